@@ -0,0 +1,92 @@
+"""On-disk cache of Exa Answer API results, shared by the enrichment scripts.
+
+Results live in a SQLite file, one table per script. Each entry is keyed by
+the sha256 of the query text plus the output schema it was asked with, so
+editing a schema invalidates the old answers automatically. Entries older
+than the TTL (30 days by default) are treated as misses.
+
+Queries often differ only in surrounding context for the same person (a
+reworded bio, an extra link), so callers can also pass an identity string
+(e.g. name + LinkedIn). Identity entries sit in a second table, scoped to a
+namespace such as the input CSV's name, and are consulted only when the
+exact query misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+
+CACHE_PATH = ".exa_cache.db"
+CACHE_TTL = 30 * 24 * 60 * 60  # Seconds before a cached answer is re-queried
+
+
+class ExaCache:
+    """Exa results for one script, keyed by query + output schema.
+
+    Pass a namespace to enable the identity tier; without one, identities
+    given to get/put are ignored.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        schema: dict,
+        path: str = CACHE_PATH,
+        ttl: float = CACHE_TTL,
+        namespace: str | None = None,
+    ):
+        self.table = table
+        self.identity_table = f"{table}_identity"
+        self.path = path
+        self.ttl = ttl
+        self.namespace = namespace
+        self.schema_version = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        for name in (self.table, self.identity_table):
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {name} "
+                "(key TEXT PRIMARY KEY, result TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+
+    def key(self, query: str) -> str:
+        return hashlib.sha256((query + self.schema_version).encode()).hexdigest()
+
+    def identity_key(self, identity: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\n{identity}\n{self.schema_version}".encode()).hexdigest()
+
+    def _lookup(self, table: str, key: str) -> dict | list | None:
+        hit = self.conn.execute(f"SELECT result, ts FROM {table} WHERE key = ?", (key,)).fetchone()
+        if hit is None or time.time() - hit[1] >= self.ttl:
+            return None
+        return json.loads(hit[0])
+
+    def get(self, query: str, identity: str | None = None) -> dict | list | None:
+        hit = self._lookup(self.table, self.key(query))
+        if hit is None and identity and self.namespace is not None:
+            hit = self._lookup(self.identity_table, self.identity_key(identity))
+        return hit
+
+    def put(self, query: str, result: dict | list, identity: str | None = None) -> None:
+        self.put_many([(query, result, identity)])
+
+    def put_many(self, items: list[tuple[str, dict | list, str | None]]) -> None:
+        """Store several (query, result, identity) entries in one transaction."""
+        now = int(time.time())
+        exact, by_identity = [], []
+        for query, result, identity in items:
+            value = json.dumps(result)
+            exact.append((self.key(query), value, now))
+            if identity and self.namespace is not None:
+                by_identity.append((self.identity_key(identity), value, now))
+        with self.conn:
+            self.conn.executemany(f"INSERT OR REPLACE INTO {self.table} (key, result, ts) VALUES (?, ?, ?)", exact)
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {self.identity_table} (key, result, ts) VALUES (?, ?, ?)", by_identity
+            )
+
+    def close(self) -> None:
+        self.conn.close()
@@ -14,11 +14,13 @@ Fixes:
 from __future__ import annotations
 
 import csv
+import functools
 import re
 import sys
 
 INPUT = sys.argv[1] if len(sys.argv) > 1 else "fyxerofficial_500_followers.csv"
 OUTPUT = INPUT.replace(".csv", "_clean.csv")
+CLEAN_CACHE_SIZE = 1 << 16  # Distinct values memoized per column cleaner
 
 # --- Fake phone patterns ---
 FAKE_PHONES = {
@@ -27,6 +29,20 @@ FAKE_PHONES = {
     "+1-555-123-4567", "+1-407-555-1234", "+1 416-123-4567",
 }
 
+_FAKE_555 = re.compile(r'\b555[-.\s]?\d{4}\b')
+
+
+class _DigitsOnly(dict):
+    """str.translate table keeping only decimal digits (the \\d set), filled lazily."""
+
+    def __missing__(self, code: int) -> int | None:
+        keep = code if chr(code).isdecimal() else None
+        self[code] = keep
+        return keep
+
+
+_KEEP_DIGITS = _DigitsOnly()
+
 def is_fake_phone(phone: str) -> bool:
     if not phone:
         return False
@@ -34,34 +50,37 @@ def is_fake_phone(phone: str) -> bool:
     if p in FAKE_PHONES:
         return True
     # 555 area code (US fake numbers)
-    if re.search(r'\b555[-.\s]?\d{4}\b', p):
+    if _FAKE_555.search(p):
         return True
     # All same digits
-    digits = re.sub(r'\D', '', p)
+    digits = p.translate(_KEEP_DIGITS)
     if len(digits) >= 7 and len(set(digits)) <= 2:
         return True
     return False
 
 
+JUNK_PHRASES = frozenset({
+    "not publicly available", "not provided", "not found",
+    "preparing profile", "unknown", "n/a", "none", "null",
+    "protected", "http://click-to-open",
+})
+
+
 def is_junk(val: str) -> bool:
     """Check if a value is a placeholder/junk."""
-    if not val:
-        return False
-    low = val.strip().lower()
-    junk_phrases = [
-        "not publicly available", "not provided", "not found",
-        "preparing profile", "unknown", "n/a", "none", "null",
-        "protected", "http://click-to-open",
-    ]
-    return low in junk_phrases
+    return bool(val) and val.strip().lower() in JUNK_PHRASES
 
 
-def is_url_not_email(val: str) -> bool:
-    """Check if value is a URL instead of an email."""
-    if not val:
-        return False
-    v = val.strip()
-    return v.startswith("http") or v.startswith("www.") or "rocketreach.co" in v or "contactout.com" in v
+# Junk placeholders, URLs and people-search links in an email cell: a
+# whole-value junk phrase (case-insensitive), a URL prefix, or a
+# rocketreach/contactout link anywhere in the value
+_EMAIL_JUNK = r"(?i:(?:%s)\Z)|http|www\.|.*?(?:rocketreach\.co|contactout\.com)" % "|".join(
+    map(re.escape, sorted(JUNK_PHRASES))
+)
+
+# A usable email in one match: not junk, contains "@" and ".", and is not
+# an @example.com address
+_EMAIL_OK = re.compile(r"(?!%s)(?=[^@]*@)(?=.*\.)(?!.*@example\.com)" % _EMAIL_JUNK, re.DOTALL)
 
 
 def is_too_masked(val: str) -> bool:
@@ -76,14 +95,18 @@ def is_too_masked(val: str) -> bool:
     return stars > 0 and (stars / total) > 0.6
 
 
+# Trailing verified badge scraped along with the name: "nameVerified",
+# "name Verified", "name ✓ Verified", "name Verified ✓", "name · Verified",
+# "name (Verified)"
+_VERIFIED_SUFFIX = re.compile(r'\s*[·✓]?\s*\(?Verified\)?\s*✓?\s*\Z')
+
+
 def clean_full_name(name: str) -> str:
     """Remove 'Verified' suffix from names like 'usernameVerified'."""
-    if not name:
+    if not name or "Verified" not in name:
         return name
-    # Remove trailing "Verified"
-    if name.endswith("Verified"):
-        name = name[:-len("Verified")].strip()
-    return name
+    cleaned = _VERIFIED_SUFFIX.sub('', name)
+    return cleaned.strip() if cleaned != name else name
 
 
 def clean_email(email: str) -> str:
@@ -91,16 +114,11 @@ def clean_email(email: str) -> str:
     if not email:
         return ""
     # Handle multiple emails (keep first valid one)
-    emails = [e.strip() for e in email.split(",")]
-    valid = []
-    for e in emails:
-        if is_junk(e) or is_url_not_email(e) or is_too_masked(e):
-            continue
-        if "@example.com" in e:
-            continue
-        if "@" in e and "." in e and not e.startswith("http"):
-            valid.append(e)
-    return valid[0] if valid else ""
+    for e in email.split(","):
+        e = e.strip()
+        if _EMAIL_OK.match(e) and not is_too_masked(e):
+            return e
+    return ""
 
 
 def clean_phone(phone: str) -> str:
@@ -114,7 +132,7 @@ def clean_phone(phone: str) -> str:
         if is_junk(p) or is_fake_phone(p) or is_too_masked(p):
             continue
         # Must have at least 7 digits
-        digits = re.sub(r'\D', '', p)
+        digits = p.translate(_KEEP_DIGITS)
         if len(digits) >= 7:
             valid.append(p)
     return valid[0] if valid else ""
@@ -151,52 +169,61 @@ def clean_company(company: str) -> str:
 
 
 def main():
-    with open(INPUT, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames)
-        rows = list(reader)
-
-    stats = {"total": len(rows), "cleaned_phones": 0, "cleaned_emails": 0,
+    stats = {"total": 0, "cleaned_phones": 0, "cleaned_emails": 0,
              "cleaned_linkedin": 0, "cleaned_names": 0, "cleaned_roles": 0}
-
-    for row in rows:
-        # Clean full_name
-        orig = row.get("full_name", "")
-        row["full_name"] = clean_full_name(orig)
-        if row["full_name"] != orig:
-            stats["cleaned_names"] += 1
-
-        # Clean email
-        orig = row.get("email", "")
-        row["email"] = clean_email(orig)
-        if row["email"] != orig:
-            stats["cleaned_emails"] += 1
-
-        # Clean phone
-        orig = row.get("phone_number", "")
-        row["phone_number"] = clean_phone(orig)
-        if row["phone_number"] != orig:
-            stats["cleaned_phones"] += 1
-
-        # Clean linkedin
-        orig = row.get("linkedin", "")
-        row["linkedin"] = clean_linkedin(orig)
-        if row["linkedin"] != orig:
-            stats["cleaned_linkedin"] += 1
-
-        # Clean role & company
-        orig_r = row.get("role", "")
-        row["role"] = clean_role(orig_r)
-        orig_c = row.get("company", "")
-        row["company"] = clean_company(orig_c)
-        if row["role"] != orig_r or row["company"] != orig_c:
-            stats["cleaned_roles"] += 1
-
-    # Write cleaned CSV
-    with open(OUTPUT, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    quality = {"linkedin": 0, "email": 0, "phone": 0, "role": 0, "any": 0}
+
+    # Bind cleaners to locals so the hot loop skips global lookups. Scraped
+    # columns repeat the same values ("", "Not provided", shared company
+    # names...), so each cleaner is memoized and runs once per distinct cell.
+    memo = functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)
+    _name, _email, _phone = memo(clean_full_name), memo(clean_email), memo(clean_phone)
+    _linkedin, _role, _company = memo(clean_linkedin), memo(clean_role), memo(clean_company)
+
+    # Stream rows straight from the input to the cleaned CSV
+    with open(INPUT, newline="", encoding="utf-8") as f_in, \
+            open(OUTPUT, "w", newline="", encoding="utf-8") as f_out:
+        reader = csv.DictReader(f_in)
+        writer = csv.DictWriter(f_out, fieldnames=list(reader.fieldnames))
         writer.writeheader()
-        writer.writerows(rows)
+
+        for row in reader:
+            get = row.get
+            name, email, phone = get("full_name", ""), get("email", ""), get("phone_number", "")
+            linkedin, role, company = get("linkedin", ""), get("role", ""), get("company", "")
+
+            new_name = _name(name)
+            new_email = _email(email)
+            new_phone = _phone(phone)
+            new_linkedin = _linkedin(linkedin)
+            new_role = _role(role)
+            new_company = _company(company)
+
+            row["full_name"] = new_name
+            row["email"] = new_email
+            row["phone_number"] = new_phone
+            row["linkedin"] = new_linkedin
+            row["role"] = new_role
+            row["company"] = new_company
+            writer.writerow(row)
+
+            stats["total"] += 1
+            if new_name != name:
+                stats["cleaned_names"] += 1
+            if new_email != email:
+                stats["cleaned_emails"] += 1
+            if new_phone != phone:
+                stats["cleaned_phones"] += 1
+            if new_linkedin != linkedin:
+                stats["cleaned_linkedin"] += 1
+            if new_role != role or new_company != company:
+                stats["cleaned_roles"] += 1
+
+            quality["linkedin"] += bool(new_linkedin)
+            quality["email"] += bool(new_email)
+            quality["phone"] += bool(new_phone)
+            quality["role"] += bool(new_role)
+            quality["any"] += bool(new_linkedin or new_email or new_phone)
 
     # Print summary
     print(f"Cleaned {INPUT} -> {OUTPUT}")
@@ -207,19 +234,12 @@ def main():
     print(f"  LinkedIn cleaned: {stats['cleaned_linkedin']}")
     print(f"  Roles cleaned:    {stats['cleaned_roles']}")
 
-    # Print final stats
-    has_linkedin = sum(1 for r in rows if r.get("linkedin"))
-    has_email = sum(1 for r in rows if r.get("email"))
-    has_phone = sum(1 for r in rows if r.get("phone_number"))
-    has_role = sum(1 for r in rows if r.get("role"))
-    has_any = sum(1 for r in rows if r.get("linkedin") or r.get("email") or r.get("phone_number"))
-
     print(f"\n  Final data quality:")
-    print(f"    With LinkedIn:  {has_linkedin}/{stats['total']}")
-    print(f"    With email:     {has_email}/{stats['total']}")
-    print(f"    With phone:     {has_phone}/{stats['total']}")
-    print(f"    With role:      {has_role}/{stats['total']}")
-    print(f"    With any data:  {has_any}/{stats['total']}")
+    print(f"    With LinkedIn:  {quality['linkedin']}/{stats['total']}")
+    print(f"    With email:     {quality['email']}/{stats['total']}")
+    print(f"    With phone:     {quality['phone']}/{stats['total']}")
+    print(f"    With role:      {quality['role']}/{stats['total']}")
+    print(f"    With any data:  {quality['any']}/{stats['total']}")
 
 
 if __name__ == "__main__":
@@ -17,9 +17,11 @@ import json
 import os
 import sys
 import time
-import urllib.request
 
-print = lambda *a, **k: __builtins__.__dict__["print"](*a, **k, flush=True)  # noqa: A001
+from exa_client import ExaClient, body_tail, json_dumps, json_loads
+
+# Flush each line immediately (for background runs)
+sys.stdout.reconfigure(line_buffering=True)
 
 EXA_API_KEY = os.environ.get("EXA_API_KEY")
 if not EXA_API_KEY:
@@ -38,6 +40,12 @@ OUTPUT_SCHEMA = {
     "required": ["linkedin", "email", "phone_number", "role", "company"],
 }
 
+_BODY_TAIL = body_tail(OUTPUT_SCHEMA)
+
+# One call per follower, made as is: no pacing and no retries
+exa = ExaClient(EXA_API_KEY, "ig-enrich/1.0", max_retries=0)
+
+
 EMPTY = {"linkedin": "", "email": "", "phone_number": "", "role": "", "company": ""}
 
 
@@ -56,25 +64,14 @@ def enrich(username: str, full_name: str = "", bio: str = "", url: str = "") ->
     )
     query = " ".join(lines)
 
-    body = json.dumps({"query": query, "text": True, "outputSchema": OUTPUT_SCHEMA}).encode()
-    req = urllib.request.Request(
-        "https://api.exa.ai/answer",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "ig-enrich/1.0",
-            "x-api-key": EXA_API_KEY,
-        },
-    )
-
+    body = b'{"query":' + json_dumps(query) + _BODY_TAIL
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        err_body = e.read().decode()
-        print(f"    API error ({e.code}): {err_body[:200]}")
-        return EMPTY.copy()
+        status, raw = exa.post_answer(body, timeout=30)
+        if status >= 400:
+            err_body = raw.decode(errors="replace")
+            print(f"    API error ({status}): {err_body[:200]}")
+            return EMPTY.copy()
+        data = json_loads(raw)
     except Exception as e:
         print(f"    Request failed: {e}")
         return EMPTY.copy()
@@ -82,7 +79,7 @@ def enrich(username: str, full_name: str = "", bio: str = "", url: str = "") ->
     answer = data.get("answer", {})
     if isinstance(answer, str):
         try:
-            answer = json.loads(answer)
+            answer = json_loads(answer)
         except (json.JSONDecodeError, TypeError):
             return EMPTY.copy()
 
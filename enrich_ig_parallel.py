@@ -16,10 +16,12 @@ import json
 import os
 import sys
 import time
-import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-print = lambda *a, **k: __builtins__.__dict__["print"](*a, **k, flush=True)
+from exa_client import ExaClient, body_tail, json_dumps, json_loads
+
+# Flush each line immediately (for background runs)
+sys.stdout.reconfigure(line_buffering=True)
 
 EXA_API_KEY = os.environ.get("EXA_API_KEY")
 if not EXA_API_KEY:
@@ -38,6 +40,12 @@ OUTPUT_SCHEMA = {
     "required": ["linkedin", "email", "phone_number", "role", "company"],
 }
 
+_BODY_TAIL = body_tail(OUTPUT_SCHEMA)
+
+# One call per follower, made as is: no pacing and no retries
+exa = ExaClient(EXA_API_KEY, "ig-enrich/1.0", max_retries=0)
+
+
 EMPTY = {"linkedin": "", "email": "", "phone_number": "", "role": "", "company": ""}
 
 
@@ -56,28 +64,17 @@ def enrich(username: str, full_name: str = "", bio: str = "", url: str = "") ->
     )
     query = " ".join(lines)
 
-    body = json.dumps({"query": query, "text": True, "outputSchema": OUTPUT_SCHEMA}).encode()
-    req = urllib.request.Request(
-        "https://api.exa.ai/answer",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "ig-enrich/1.0",
-            "x-api-key": EXA_API_KEY,
-        },
-    )
-
+    body = b'{"query":' + json_dumps(query) + _BODY_TAIL
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        err_body = e.read().decode()
-        if "NO_MORE_CREDITS" in err_body or e.code == 402:
-            print(f"    CREDITS EXHAUSTED - stopping")
-            return {"_stop": True, **EMPTY}
-        print(f"    API error ({e.code}): {err_body[:200]}")
-        return EMPTY.copy()
+        status, raw = exa.post_answer(body, timeout=30)
+        if status >= 400:
+            err_body = raw.decode(errors="replace")
+            if "NO_MORE_CREDITS" in err_body or status == 402:
+                print(f"    CREDITS EXHAUSTED - stopping")
+                return {"_stop": True, **EMPTY}
+            print(f"    API error ({status}): {err_body[:200]}")
+            return EMPTY.copy()
+        data = json_loads(raw)
     except Exception as e:
         print(f"    Request failed: {e}")
         return EMPTY.copy()
@@ -85,7 +82,7 @@ def enrich(username: str, full_name: str = "", bio: str = "", url: str = "") ->
     answer = data.get("answer", {})
     if isinstance(answer, str):
         try:
-            answer = json.loads(answer)
+            answer = json_loads(answer)
         except (json.JSONDecodeError, TypeError):
             return EMPTY.copy()
 
@@ -158,11 +155,12 @@ def main():
     # Process in batches
     batch_size = workers
     i = start
-    while i < total and not credits_exhausted:
-        batch_end = min(i + batch_size, total)
-        batch_indices = list(range(i, batch_end))
+    # One pool for the whole run so worker threads keep their connections
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while i < total and not credits_exhausted:
+            batch_end = min(i + batch_size, total)
+            batch_indices = list(range(i, batch_end))
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {}
             for idx in batch_indices:
                 row = rows[idx]
@@ -202,15 +200,15 @@ def main():
                     print(f"[{idx+1}/{total}] {label}")
                     print(f"    —")
 
-        i = batch_end
+            i = batch_end
 
-        # Save progress periodically
-        if i % save_interval == 0 or i >= total or credits_exhausted:
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=out_fields, extrasaction="ignore")
-                writer.writeheader()
-                writer.writerows(rows)
-            print(f"  [saved progress: {i}/{total}]")
+            # Save progress periodically
+            if i % save_interval == 0 or i >= total or credits_exhausted:
+                with open(output_path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=out_fields, extrasaction="ignore")
+                    writer.writeheader()
+                    writer.writerows(rows)
+                print(f"  [saved progress: {i}/{total}]")
 
     if credits_exhausted:
         print(f"\nCredits exhausted at row {i}.")
@@ -1,21 +1,41 @@
 #!/usr/bin/env python3
 """Enrich a CSV of people with LinkedIn, role, and email using Exa Answer API (batched)."""
 
+from __future__ import annotations
+
+import argparse
 import csv
+import itertools
 import json
 import os
 import sys
-import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from cache import CACHE_PATH, ExaCache
+from exa_client import ExaClient, body_tail, json_dumps, json_loads, lookup_in_order
+from people import build_people_list, describe_person, report_batch
 
 EXA_API_KEY = os.environ.get("EXA_API_KEY")
 if not EXA_API_KEY:
     print("Error: EXA_API_KEY environment variable not set")
     sys.exit(1)
 
-INPUT_CSV = sys.argv[1] if len(sys.argv) > 1 else "people.csv"
-OUTPUT_CSV = sys.argv[2] if len(sys.argv) > 2 else INPUT_CSV.replace(".csv", "_enriched.csv")
-BATCH_SIZE = 5  # People per API call
+parser = argparse.ArgumentParser(description="Enrich a CSV of people with LinkedIn, role and email via Exa.")
+parser.add_argument("input_csv", nargs="?", default="people.csv", help="Input CSV file")
+parser.add_argument("output_csv", nargs="?", default=None, help="Output CSV path")
+parser.add_argument("--no-cache", action="store_true", help="Ignore cached results and re-query everyone")
+parser.add_argument("--batch-size", type=int, default=10, help="People per API call (default: 10)")
+parser.add_argument("--workers", type=int, default=8, help="Batches in flight at once (default: 8)")
+args = parser.parse_args()
+
+INPUT_CSV = args.input_csv
+OUTPUT_CSV = args.output_csv or INPUT_CSV.replace(".csv", "_enriched.csv")
+NO_CACHE = args.no_cache
+CACHE_TABLE = "linkedin_answers"  # Per-person results in the shared Exa cache
+BATCH_SIZE = args.batch_size  # People per API call
+WORKERS = args.workers
+REQUESTS_PER_SEC = 2.0  # Cap on API call starts across all workers
+ENRICH_COLS = ("linkedin", "role", "email", "additional_links")  # Columns filled in from Exa
 
 OUTPUT_SCHEMA = {
     "type": "object",
@@ -54,24 +74,11 @@ OUTPUT_SCHEMA = {
     "required": ["people"],
 }
 
+_BODY_TAIL = body_tail(OUTPUT_SCHEMA)
+
 
-def build_people_list(rows: list[dict]) -> str:
-    """Build a text list of people from CSV rows."""
-    lines = []
-    for row in rows:
-        name = row.get("name", "").strip()
-        parts = [name]
-        title = row.get("title", "").strip()
-        company = row.get("company", "").strip()
-        instagram = row.get("instagram", "").strip()
-        if title:
-            parts.append(title)
-        if company:
-            parts.append(f"at {company}")
-        if instagram:
-            parts.append(f"(Instagram: @{instagram.lstrip('@')})")
-        lines.append(" - ".join(parts))
-    return "\n".join(lines)
+# Failed calls are not retried; the batch is reported as having no results
+exa = ExaClient(EXA_API_KEY, "exa-enrich/1.0", REQUESTS_PER_SEC, max_retries=0)
 
 
 def enrich_batch(rows: list[dict]) -> list[dict]:
@@ -84,30 +91,15 @@ def enrich_batch(rows: list[dict]) -> list[dict]:
         f"Give in array structure."
     )
 
-    body = json.dumps({
-        "query": query,
-        "text": True,
-        "outputSchema": OUTPUT_SCHEMA,
-    }).encode()
-
-    req = urllib.request.Request(
-        "https://api.exa.ai/answer",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "exa-enrich/1.0",
-            "x-api-key": EXA_API_KEY,
-        },
-    )
+    body = b'{"query":' + json_dumps(query) + _BODY_TAIL
 
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        err_body = e.read().decode()
-        print(f"  API error ({e.code}): {err_body}")
-        return []
+        status, raw = exa.post_answer(body, timeout=60)
+        if status >= 400:
+            err_body = raw.decode(errors="replace")
+            print(f"  API error ({status}): {err_body}")
+            return []
+        data = json_loads(raw)
     except Exception as e:
         print(f"  Request failed: {e}")
         return []
@@ -116,7 +108,7 @@ def enrich_batch(rows: list[dict]) -> list[dict]:
 
     if isinstance(answer, str):
         try:
-            answer = json.loads(answer)
+            answer = json_loads(answer)
         except (json.JSONDecodeError, TypeError):
             print(f"  Could not parse response: {answer[:200]}")
             return []
@@ -127,80 +119,65 @@ def enrich_batch(rows: list[dict]) -> list[dict]:
     return answer if isinstance(answer, list) else []
 
 
-def match_results(rows: list[dict], results: list[dict]) -> None:
-    """Match API results back to CSV rows by name."""
-    # Index results by lowercase name for fuzzy matching
-    result_map = {}
-    for r in results:
-        rname = r.get("name", "").strip().lower()
-        if rname:
-            result_map[rname] = r
-
-    for row in rows:
-        name = row.get("name", "").strip().lower()
-        match = result_map.get(name)
-        if match:
-            row["linkedin"] = match.get("linkedin", "")
-            row["role"] = match.get("role", row.get("role", ""))
-            row["email"] = match.get("email", "")
-            row["additional_links"] = "; ".join(match.get("additional_links", []))
-        else:
-            row.setdefault("linkedin", "")
-            row.setdefault("email", "")
-            row.setdefault("additional_links", "")
+def apply_result(row: dict, match: dict) -> None:
+    """Copy one person's API result onto their CSV row."""
+    row["linkedin"] = match.get("linkedin", "")
+    row["role"] = match.get("role", row.get("role", ""))
+    row["email"] = match.get("email", "")
+    row["additional_links"] = "; ".join(match.get("additional_links", []))
+
+
+def show_result(r: dict) -> None:
+    """Print the fields of one person's API result."""
+    links = r.get("additional_links", [])
+    print(f"    role:     {r.get('role', '')}")
+    print(f"    email:    {r.get('email', '') or '-'}")
+    print(f"    linkedin: {r.get('linkedin', '') or '-'}")
+    if links:
+        print(f"    links:    {', '.join(links)}")
 
 
 def main():
-    with open(INPUT_CSV, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    with open(INPUT_CSV, newline="", encoding="utf-8") as f_in, \
+            open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f_out:
+        reader = csv.DictReader(f_in)
         fieldnames = list(reader.fieldnames)
-        rows = list(reader)
-
-    # Add enrichment columns
-    for col in ("linkedin", "role", "email", "additional_links"):
-        if col not in fieldnames:
-            fieldnames.append(col)
-
-    print(f"Processing {len(rows)} people from {INPUT_CSV} (batch size: {BATCH_SIZE})...\n")
-
-    # Process in batches
-    for start in range(0, len(rows), BATCH_SIZE):
-        batch = rows[start : start + BATCH_SIZE]
-        batch_num = (start // BATCH_SIZE) + 1
-        total_batches = (len(rows) + BATCH_SIZE - 1) // BATCH_SIZE
-
-        names = [r.get("name", "").strip() for r in batch]
-        print(f"[Batch {batch_num}/{total_batches}] {', '.join(names)}")
-
-        results = enrich_batch(batch)
-
-        if results:
-            match_results(batch, results)
-            for r in results:
-                name = r.get("name", "")
-                linkedin = r.get("linkedin", "")
-                role = r.get("role", "")
-                email = r.get("email", "")
-                links = r.get("additional_links", [])
-                print(f"  {name}")
-                print(f"    role:     {role}")
-                print(f"    email:    {email or '-'}")
-                print(f"    linkedin: {linkedin or '-'}")
-                if links:
-                    print(f"    links:    {', '.join(links)}")
-        else:
-            print("  No results returned")
-
-        # Rate limit between batches
-        if start + BATCH_SIZE < len(rows):
-            time.sleep(1)
-
-    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+
+        # Add enrichment columns
+        for col in ENRICH_COLS:
+            if col not in fieldnames:
+                fieldnames.append(col)
+
+        writer = csv.DictWriter(f_out, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(rows)
 
-    print(f"\nDone! Enriched CSV -> {OUTPUT_CSV}")
+        print(f"Processing people from {INPUT_CSV} (batch size: {BATCH_SIZE}, {WORKERS} workers)...\n")
+
+        cache = ExaCache(CACHE_TABLE, OUTPUT_SCHEMA)
+        cached = None if NO_CACHE else lambda row, person: cache.get(person)
+        batch_numbers = itertools.count(1)
+
+        def finish(batch, results):
+            matches = report_batch(str(next(batch_numbers)), batch, results, show_result)
+            cache.put_many([(describe_person(row), match, None) for row, match in zip(batch, matches) if match])
+            return matches
+
+        total = hits = repeated = 0
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            looked_up = lookup_in_order(
+                executor, reader, describe_person, cached, enrich_batch, finish, BATCH_SIZE, WORKERS * 2
+            )
+            for row, result, how in looked_up:
+                total += 1
+                hits += how == "cached"
+                repeated += how == "repeat"
+                if result:
+                    apply_result(row, result)
+                writer.writerow(row)
+
+        cache.close()
+
+    print(f"\nDone! {total} people ({hits} from cache {CACHE_PATH}, {repeated} repeats) -> {OUTPUT_CSV}")
 
 
 if __name__ == "__main__":
@@ -1,21 +1,50 @@
 #!/usr/bin/env python3
 """Enrich a CSV of people (name + Instagram) with phone numbers using Exa Answer API (batched)."""
 
+from __future__ import annotations
+
+import argparse
+import collections
 import csv
+import itertools
 import json
 import os
 import sys
-import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from cache import CACHE_PATH, ExaCache
+from exa_client import ExaClient, body_tail, json_dumps, json_loads, lookup_in_order
+from people import build_people_list, describe_person, name_key, report_batch
+from resume import load_done_keys, skip_done
 
 EXA_API_KEY = os.environ.get("EXA_API_KEY")
 if not EXA_API_KEY:
     print("Error: EXA_API_KEY environment variable not set")
     sys.exit(1)
 
-INPUT_CSV = sys.argv[1] if len(sys.argv) > 1 else "people.csv"
-OUTPUT_CSV = sys.argv[2] if len(sys.argv) > 2 else INPUT_CSV.replace(".csv", "_phones.csv")
+parser = argparse.ArgumentParser(description="Enrich a CSV of people with phone numbers via Exa.")
+parser.add_argument("input_csv", nargs="?", default="people.csv", help="Input CSV file")
+parser.add_argument("output_csv", nargs="?", default=None, help="Output CSV path")
+parser.add_argument("--no-cache", action="store_true", help="Ignore cached results and re-query everyone")
+parser.add_argument(
+    "--no-identity-cache", action="store_true",
+    help="Only reuse answers to the exact same query, not earlier answers for the same person",
+)
+parser.add_argument("--resume", action="store_true", help="Append to an existing output CSV, skipping people already in it")
+parser.add_argument("--workers", type=int, default=8, help="Batches in flight at once (default: 8)")
+args = parser.parse_args()
+
+INPUT_CSV = args.input_csv
+OUTPUT_CSV = args.output_csv or INPUT_CSV.replace(".csv", "_phones.csv")
+NO_CACHE = args.no_cache
+RESUME = args.resume
+CACHE_NAMESPACE = None if args.no_identity_cache else os.path.basename(INPUT_CSV)
+CACHE_TABLE = "phones_answers"  # Per-person results in the shared Exa cache
 BATCH_SIZE = 5
+WORKERS = args.workers
+REQUESTS_PER_SEC = 2.0  # Cap on API call starts across all workers
+ENRICH_COLS = ("phone_number", "email", "source")  # Columns filled in from Exa
+KEY_COLS = ("name", "title", "company", "instagram")  # Columns describe_person reads
 
 OUTPUT_SCHEMA = {
     "type": "object",
@@ -49,24 +78,10 @@ OUTPUT_SCHEMA = {
     "required": ["people"],
 }
 
+_BODY_TAIL = body_tail(OUTPUT_SCHEMA)
 
-def build_people_list(rows: list[dict]) -> str:
-    """Build a text list of people from CSV rows."""
-    lines = []
-    for row in rows:
-        name = row.get("name", "").strip()
-        parts = [name]
-        title = row.get("title", "").strip()
-        company = row.get("company", "").strip()
-        instagram = row.get("instagram", "").strip()
-        if title:
-            parts.append(title)
-        if company:
-            parts.append(f"at {company}")
-        if instagram:
-            parts.append(f"(Instagram: @{instagram.lstrip('@')})")
-        lines.append(" - ".join(parts))
-    return "\n".join(lines)
+
+exa = ExaClient(EXA_API_KEY, "exa-enrich/1.0", REQUESTS_PER_SEC)
 
 
 def enrich_batch(rows: list[dict]) -> list[dict]:
@@ -80,30 +95,15 @@ def enrich_batch(rows: list[dict]) -> list[dict]:
         f"Give in array structure."
     )
 
-    body = json.dumps({
-        "query": query,
-        "text": True,
-        "outputSchema": OUTPUT_SCHEMA,
-    }).encode()
-
-    req = urllib.request.Request(
-        "https://api.exa.ai/answer",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "exa-enrich/1.0",
-            "x-api-key": EXA_API_KEY,
-        },
-    )
+    body = b'{"query":' + json_dumps(query) + _BODY_TAIL
 
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        err_body = e.read().decode()
-        print(f"  API error ({e.code}): {err_body}")
-        return []
+        status, raw = exa.post_answer(body, timeout=60)
+        if status >= 400:
+            err_body = raw.decode(errors="replace")
+            print(f"  API error ({status}): {err_body}")
+            return []
+        data = json_loads(raw)
     except Exception as e:
         print(f"  Request failed: {e}")
         return []
@@ -112,7 +112,7 @@ def enrich_batch(rows: list[dict]) -> list[dict]:
 
     if isinstance(answer, str):
         try:
-            answer = json.loads(answer)
+            answer = json_loads(answer)
         except (json.JSONDecodeError, TypeError):
             print(f"  Could not parse response: {answer[:200]}")
             return []
@@ -123,72 +123,76 @@ def enrich_batch(rows: list[dict]) -> list[dict]:
     return answer if isinstance(answer, list) else []
 
 
-def match_results(rows: list[dict], results: list[dict]) -> None:
-    """Match API results back to CSV rows by name."""
-    result_map = {}
-    for r in results:
-        rname = r.get("name", "").strip().lower()
-        if rname:
-            result_map[rname] = r
-
-    for row in rows:
-        name = row.get("name", "").strip().lower()
-        match = result_map.get(name)
-        if match:
-            row["phone_number"] = match.get("phone_number", "")
-            row["email"] = match.get("email", "")
-            row["source"] = match.get("source", "")
-        else:
-            row.setdefault("phone_number", "")
-            row.setdefault("email", "")
-            row.setdefault("source", "")
+def apply_result(row: dict, match: dict) -> None:
+    """Copy one person's API result onto their CSV row."""
+    row["phone_number"] = match.get("phone_number", "")
+    row["email"] = match.get("email", "")
+    row["source"] = match.get("source", "")
+
+
+def person_identity(row: dict) -> str | None:
+    """Who a row refers to regardless of the query wording: name plus Instagram handle."""
+    name = name_key(row.get("name", ""))
+    instagram = row.get("instagram", "").strip().lstrip("@").lower()
+    return f"{name}|{instagram}" if name and instagram else None
+
+
+def show_result(r: dict) -> None:
+    """Print the fields of one person's API result."""
+    print(f"    phone:  {r.get('phone_number', '') or '-'}")
+    print(f"    email:  {r.get('email', '') or '-'}")
+    print(f"    source: {r.get('source', '') or '-'}")
 
 
 def main():
-    with open(INPUT_CSV, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames)
-        rows = list(reader)
-
-    for col in ("phone_number", "email", "source"):
-        if col not in fieldnames:
-            fieldnames.append(col)
-
-    print(f"Processing {len(rows)} people from {INPUT_CSV} (batch size: {BATCH_SIZE})...\n")
-
-    for start in range(0, len(rows), BATCH_SIZE):
-        batch = rows[start : start + BATCH_SIZE]
-        batch_num = (start // BATCH_SIZE) + 1
-        total_batches = (len(rows) + BATCH_SIZE - 1) // BATCH_SIZE
-
-        names = [r.get("name", "").strip() for r in batch]
-        print(f"[Batch {batch_num}/{total_batches}] {', '.join(names)}")
-
-        results = enrich_batch(batch)
-
-        if results:
-            match_results(batch, results)
-            for r in results:
-                name = r.get("name", "")
-                phone = r.get("phone_number", "")
-                email = r.get("email", "")
-                source = r.get("source", "")
-                print(f"  {name}")
-                print(f"    phone:  {phone or '-'}")
-                print(f"    email:  {email or '-'}")
-                print(f"    source: {source or '-'}")
-        else:
-            print("  No results returned")
+    done = load_done_keys(OUTPUT_CSV, KEY_COLS, describe_person) if RESUME else collections.Counter()
 
-        if start + BATCH_SIZE < len(rows):
-            time.sleep(1)
+    with open(INPUT_CSV, newline="", encoding="utf-8") as f_in, \
+            open(OUTPUT_CSV, "a" if done else "w", newline="", encoding="utf-8") as f_out:
+        reader = csv.DictReader(f_in)
+        fieldnames = list(reader.fieldnames)
 
-    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        for col in ENRICH_COLS:
+            if col not in fieldnames:
+                fieldnames.append(col)
 
-    print(f"\nDone! Enriched CSV -> {OUTPUT_CSV}")
+        writer = csv.DictWriter(f_out, fieldnames=fieldnames)
+        rows = reader
+        if done:
+            print(f"Resuming: skipping {sum(done.values())} rows already in {OUTPUT_CSV}")
+            rows = skip_done(reader, done, describe_person)
+        else:
+            writer.writeheader()
+
+        print(f"Processing people from {INPUT_CSV} (batch size: {BATCH_SIZE}, {WORKERS} workers)...\n")
+
+        cache = ExaCache(CACHE_TABLE, OUTPUT_SCHEMA, namespace=CACHE_NAMESPACE)
+        cached = None if NO_CACHE else lambda row, person: cache.get(person, person_identity(row))
+        batch_numbers = itertools.count(1)
+
+        def finish(batch, results):
+            matches = report_batch(str(next(batch_numbers)), batch, results, show_result)
+            cache.put_many(
+                [(describe_person(row), match, person_identity(row)) for row, match in zip(batch, matches) if match]
+            )
+            return matches
+
+        total = hits = repeated = 0
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            looked_up = lookup_in_order(
+                executor, rows, describe_person, cached, enrich_batch, finish, BATCH_SIZE, WORKERS * 2
+            )
+            for row, result, how in looked_up:
+                total += 1
+                hits += how == "cached"
+                repeated += how == "repeat"
+                if result:
+                    apply_result(row, result)
+                writer.writerow(row)
+
+        cache.close()
+
+    print(f"\nDone! {total} people ({hits} from cache {CACHE_PATH}, {repeated} repeats) -> {OUTPUT_CSV}")
 
 
 if __name__ == "__main__":
@@ -5,21 +5,53 @@ Parses existing data (email, bio, LinkedIn, location) from the CSV
 and uses it as context for each Exa query to maximize hit rate.
 """
 
+from __future__ import annotations
+
+import argparse
+import collections
 import csv
+import itertools
 import json
+import operator
 import os
 import sys
-import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from cache import CACHE_PATH, ExaCache
+from exa_client import ExaClient, body_tail, json_dumps, json_loads, lookup_in_order
+from resume import load_done_keys, skip_done
 
 EXA_API_KEY = os.environ.get("EXA_API_KEY")
 if not EXA_API_KEY:
     print("Error: EXA_API_KEY environment variable not set")
     sys.exit(1)
 
-INPUT_CSV = sys.argv[1] if len(sys.argv) > 1 else "us_superhuman_users_final_comprehensive.csv"
-OUTPUT_CSV = sys.argv[2] if len(sys.argv) > 2 else INPUT_CSV.replace(".csv", "_enriched.csv")
-LIMIT = int(sys.argv[3]) if len(sys.argv) > 3 else None  # Optional: only process first N rows
+parser = argparse.ArgumentParser(description="Enrich a Superhuman user CSV with phone numbers via Exa.")
+parser.add_argument("input_csv", nargs="?", default="us_superhuman_users_final_comprehensive.csv", help="Input CSV file")
+parser.add_argument("output_csv", nargs="?", default=None, help="Output CSV path")
+parser.add_argument("limit", nargs="?", type=int, default=None, help="Only process the first N rows")
+parser.add_argument("--no-cache", action="store_true", help="Ignore cached results and re-query everyone")
+parser.add_argument(
+    "--no-identity-cache", action="store_true",
+    help="Only reuse answers to the exact same query, not earlier answers for the same person",
+)
+parser.add_argument("--resume", action="store_true", help="Append to an existing output CSV, skipping people already in it")
+parser.add_argument("--batch-size", type=int, default=5, help="People per API call, 1 to disable batching (default: 5)")
+parser.add_argument("--workers", type=int, default=8, help="Lookups in flight at once (default: 8)")
+args = parser.parse_args()
+
+INPUT_CSV = args.input_csv
+OUTPUT_CSV = args.output_csv or INPUT_CSV.replace(".csv", "_enriched.csv")
+LIMIT = args.limit  # Optional: only process first N rows
+NO_CACHE = args.no_cache
+RESUME = args.resume
+CACHE_NAMESPACE = None if args.no_identity_cache else os.path.basename(INPUT_CSV)
+CACHE_TABLE = "superhuman_answers"  # Per-person results in the shared Exa cache
+KEY_COLS = ("name", "email", "bio")  # Input columns that identify a row for --resume
+BATCH_SIZE = args.batch_size  # People per API call
+WORKERS = args.workers
+REQUESTS_PER_SEC = 2.0  # Cap on API call starts across all workers
+PROGRESS_TOTAL = f"/{LIMIT}" if LIMIT else ""  # Shown after the row number when a limit is set
 
 OUTPUT_SCHEMA = {
     "type": "object",
@@ -48,6 +80,50 @@ OUTPUT_SCHEMA = {
     "required": ["phone_number", "phone_source", "personal_email", "twitter", "website"],
 }
 
+# Several people per call: the same fields per person, plus the number
+# they were listed under so answers can be matched back
+BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "description": "The number the person was listed under.",
+                    },
+                    **OUTPUT_SCHEMA["properties"],
+                },
+                "required": ["id", *OUTPUT_SCHEMA["required"]],
+            },
+        },
+    },
+    "required": ["results"],
+}
+
+_BODY_TAIL = body_tail(OUTPUT_SCHEMA)
+_BATCH_BODY_TAIL = body_tail(BATCH_SCHEMA)
+
+SEARCH_HINT = (
+    "Search public directories, personal websites, contact pages, "
+    "Crunchbase, AngelList, company about pages, and any public records."
+)
+EMPTY = {"phone_number": "", "phone_source": "", "personal_email": "", "twitter": "", "website": ""}
+
+# Output CSV column -> result field it is filled from
+RESULT_COLUMNS = {
+    "phone_number": "phone_number",
+    "phone_source": "phone_source",
+    "personal_email": "personal_email",
+    "found_twitter": "twitter",
+    "found_website": "website",
+}
+
+
+exa = ExaClient(EXA_API_KEY, "exa-enrich/1.0", REQUESTS_PER_SEC)
+
 
 def parse_raw(row: dict) -> dict:
     """Extract useful context from the raw_response JSON."""
@@ -66,7 +142,7 @@ def parse_raw(row: dict) -> dict:
         return ctx
 
     try:
-        data = json.loads(raw)
+        data = json_loads(raw)
     except (json.JSONDecodeError, TypeError):
         return ctx
 
@@ -86,12 +162,16 @@ def parse_raw(row: dict) -> dict:
     return ctx
 
 
-def find_phone(ctx: dict) -> dict:
-    """Use Exa Answer API to find a person's phone number with full context."""
+def person_identity(ctx: dict) -> str | None:
+    """Who a row refers to regardless of bio or link wording: name plus LinkedIn or email."""
+    name = " ".join(ctx["name"].casefold().split())
+    anchor = (ctx["linkedin"] or ctx["email"]).strip().rstrip("/").lower()
+    return f"{name}|{anchor}" if name and anchor else None
 
-    # Build a rich context query
-    lines = [f"Find the phone number for {ctx['name']}."]
 
+def context_lines(ctx: dict) -> list[str]:
+    """What the CSV tells us about a person, one sentence each."""
+    lines = []
     if ctx["bio"]:
         lines.append(f"They are {ctx['bio']}.")
     if ctx["location"]:
@@ -104,126 +184,192 @@ def find_phone(ctx: dict) -> dict:
         lines.append(f"Their Twitter is {ctx['twitter']}.")
     if ctx["links"]:
         lines.append(f"Other profiles: {', '.join(ctx['links'])}.")
+    return lines
 
-    lines.append(
-        "Search public directories, personal websites, contact pages, "
-        "Crunchbase, AngelList, company about pages, and any public records. "
-        "Return their phone number, any alternate email, Twitter, and personal website."
-    )
 
-    query = " ".join(lines)
-
-    body = json.dumps({
-        "query": query,
-        "text": True,
-        "outputSchema": OUTPUT_SCHEMA,
-    }).encode()
-
-    req = urllib.request.Request(
-        "https://api.exa.ai/answer",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "exa-enrich/1.0",
-            "x-api-key": EXA_API_KEY,
-        },
+def build_query(ctx: dict) -> str:
+    """Build a rich context query for one person."""
+    return " ".join([
+        f"Find the phone number for {ctx['name']}.",
+        *context_lines(ctx),
+        f"{SEARCH_HINT} Return their phone number, any alternate email, Twitter, and personal website.",
+    ])
+
+
+def build_batch_query(ctxs: list[dict]) -> str:
+    """Build one numbered query covering several people."""
+    people = "\n".join(
+        f"{i}) " + " ".join([f"{ctx['name']}.", *context_lines(ctx)]) for i, ctx in enumerate(ctxs, 1)
+    )
+    return (
+        f"Find the phone number for each of these people:\n\n{people}\n\n"
+        f"{SEARCH_HINT} For each person return the number they are listed under, their phone number, "
+        "any alternate email, Twitter, and personal website."
     )
 
-    empty = {"phone_number": "", "phone_source": "", "personal_email": "", "twitter": "", "website": ""}
 
+def ask_exa(body: bytes) -> dict | list | None:
+    """Send one query body to Exa. Returns the decoded answer, {} if it could
+    not be parsed, or None if the request itself failed."""
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        err_body = e.read().decode()
-        print(f"    API error ({e.code}): {err_body[:200]}")
-        return empty
+        status, raw = exa.post_answer(body, timeout=30)
+        if status >= 400:
+            err_body = raw.decode(errors="replace")
+            print(f"    API error ({status}): {err_body[:200]}")
+            return None
+        data = json_loads(raw)
     except Exception as e:
         print(f"    Request failed: {e}")
-        return empty
+        return None
 
     answer = data.get("answer", {})
 
     if isinstance(answer, str):
         try:
-            answer = json.loads(answer)
+            answer = json_loads(answer)
         except (json.JSONDecodeError, TypeError):
-            return empty
-
-    return {
-        "phone_number": answer.get("phone_number", ""),
-        "phone_source": answer.get("phone_source", ""),
-        "personal_email": answer.get("personal_email", ""),
-        "twitter": answer.get("twitter", ""),
-        "website": answer.get("website", ""),
-    }
+            return {}
 
+    return answer
 
-def main():
-    with open(INPUT_CSV, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames)
-        rows = list(reader)
 
-    if LIMIT:
-        rows = rows[:LIMIT]
+def pick_fields(answer: dict) -> dict:
+    return {key: answer.get(key, "") for key in EMPTY}
+
 
-    # Add enrichment columns
-    enrich_cols = ["phone_number", "phone_source", "personal_email", "found_twitter", "found_website"]
-    for col in enrich_cols:
-        if col not in fieldnames:
-            fieldnames.append(col)
+def find_phone(query: str) -> dict:
+    """Use Exa Answer API to find a person's phone number with full context."""
+    answer = ask_exa(b'{"query":' + json_dumps(query) + _BODY_TAIL)
+    return pick_fields(answer) if isinstance(answer, dict) else EMPTY.copy()
 
-    print(f"Processing {len(rows)} people from {INPUT_CSV}...\n")
 
-    found = 0
-    for i, row in enumerate(rows):
-        ctx = parse_raw(row)
-        name = ctx["name"]
-        if not name:
+def find_phone_batch(people: list[tuple[dict, str]]) -> list[dict]:
+    """Look up several (ctx, query) people in one Exa call, matched back by list number.
+
+    Anyone the batch answer leaves out, or everyone if it comes back in an
+    unexpected shape, is looked up on their own with find_phone.
+    """
+    if len(people) == 1:
+        return [find_phone(people[0][1])]
+
+    answer = ask_exa(b'{"query":' + json_dumps(build_batch_query([ctx for ctx, _ in people])) + _BATCH_BODY_TAIL)
+    if answer is None:
+        return [EMPTY.copy() for _ in people]
+    if isinstance(answer, dict):
+        answer = answer.get("results", [])
+
+    by_id = {}
+    for item in answer if isinstance(answer, list) else []:
+        try:
+            by_id.setdefault(int(item["id"]), item)
+        except (KeyError, TypeError, ValueError):
             continue
 
-        label = name
-        if ctx["bio"]:
-            label += f" — {ctx['bio']}"
-        elif ctx["location"]:
-            label += f" — {ctx['location']}"
-        print(f"[{i + 1}/{len(rows)}] {label}")
-
-        result = find_phone(ctx)
-        row["phone_number"] = result["phone_number"]
-        row["phone_source"] = result["phone_source"]
-        row["personal_email"] = result["personal_email"]
-        row["found_twitter"] = result["twitter"]
-        row["found_website"] = result["website"]
-
-        if result["phone_number"]:
-            found += 1
-            print(f"    PHONE: {result['phone_number']} (via {result['phone_source']})")
+    return [
+        pick_fields(by_id[i]) if i in by_id else find_phone(query)
+        for i, (_, query) in enumerate(people, 1)
+    ]
+
+
+def prepare_rows(rows):
+    """Yield (row, ctx, query) for each row: its parsed context and Exa query, "" if it has no name."""
+    for row in rows:
+        ctx = parse_raw(row)
+        yield row, ctx, build_query(ctx) if ctx["name"] else ""
+
+
+def lookup_batch(batch: list[tuple[dict, dict, str]]) -> list[dict]:
+    """Worker side: look up one batch of prepared rows."""
+    return find_phone_batch([(ctx, query) for _, ctx, query in batch])
+
+
+def store_results(batch: list[tuple[dict, dict, str]], results: list[dict], cache: ExaCache) -> list[dict | None]:
+    """Cache the results that found anything. Returns them, with None for the rest."""
+    found = [result if any(result.values()) else None for result in results]
+    cache.put_many([(query, result, person_identity(ctx)) for (_, ctx, query), result in zip(batch, found) if result])
+    return found
+
+
+def report_row(n: int, ctx: dict, row: dict, result: dict) -> bool:
+    """Copy a lookup result onto its CSV row and print it. Returns True if a phone was found."""
+    label = ctx["name"]
+    if ctx["bio"]:
+        label += f" — {ctx['bio']}"
+    elif ctx["location"]:
+        label += f" — {ctx['location']}"
+    print(f"[{n}{PROGRESS_TOTAL}] {label}")
+
+    row.update({col: result[key] for col, key in RESULT_COLUMNS.items()})
+
+    if result["phone_number"]:
+        print(f"    PHONE: {result['phone_number']} (via {result['phone_source']})")
+    else:
+        print(f"    no phone")
+
+    extras = []
+    if result["personal_email"]:
+        extras.append(f"email: {result['personal_email']}")
+    if result["twitter"]:
+        extras.append(f"twitter: {result['twitter']}")
+    if result["website"]:
+        extras.append(f"web: {result['website']}")
+    if extras:
+        print(f"    {' | '.join(extras)}")
+
+    return bool(result["phone_number"])
+
+
+def row_key(row: dict) -> str:
+    """Identify an input row across runs by columns the enrichment never rewrites."""
+    return "|".join(row.get(col, "").strip() for col in KEY_COLS)
+
+
+def main():
+    done = load_done_keys(OUTPUT_CSV, KEY_COLS, row_key) if RESUME else collections.Counter()
+
+    with open(INPUT_CSV, newline="", encoding="utf-8") as f_in, \
+            open(OUTPUT_CSV, "a" if done else "w", newline="", encoding="utf-8") as f_out:
+        reader = csv.DictReader(f_in)
+        fieldnames = list(reader.fieldnames)
+
+        # Add enrichment columns
+        for col in RESULT_COLUMNS:
+            if col not in fieldnames:
+                fieldnames.append(col)
+
+        writer = csv.DictWriter(f_out, fieldnames=fieldnames)
+        rows = itertools.islice(reader, LIMIT) if LIMIT else reader
+        if done:
+            print(f"Resuming: skipping {sum(done.values())} rows already in {OUTPUT_CSV}")
+            rows = skip_done(rows, done, row_key)
         else:
-            print(f"    no phone")
-
-        extras = []
-        if result["personal_email"]:
-            extras.append(f"email: {result['personal_email']}")
-        if result["twitter"]:
-            extras.append(f"twitter: {result['twitter']}")
-        if result["website"]:
-            extras.append(f"web: {result['website']}")
-        if extras:
-            print(f"    {' | '.join(extras)}")
-
-        # Rate limit
-        if i < len(rows) - 1:
-            time.sleep(0.5)
-
-    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"\nDone! {found}/{len(rows)} phone numbers found.")
+            writer.writeheader()
+
+        print(f"Processing people from {INPUT_CSV} (batch size: {BATCH_SIZE}, {WORKERS} workers)...\n")
+
+        cache = ExaCache(CACHE_TABLE, OUTPUT_SCHEMA, namespace=CACHE_NAMESPACE)
+        cached = None if NO_CACHE else lambda item, query: cache.get(query, person_identity(item[1]))
+
+        def finish(batch, results):
+            return store_results(batch, results, cache)
+
+        total = found = hits = repeated = 0
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            looked_up = lookup_in_order(
+                executor, prepare_rows(rows), operator.itemgetter(2), cached, lookup_batch, finish,
+                BATCH_SIZE, WORKERS * 2,
+            )
+            for (row, ctx, _), result, how in looked_up:
+                total += 1
+                if how:
+                    hits += how == "cached"
+                    repeated += how == "repeat"
+                    found += report_row(total, ctx, row, result or EMPTY)
+                writer.writerow(row)
+
+        cache.close()
+
+    print(f"\nDone! {found}/{total} phone numbers found ({hits} from cache {CACHE_PATH}, {repeated} repeats).")
     print(f"Enriched CSV -> {OUTPUT_CSV}")
 
 
@@ -0,0 +1,241 @@
+"""Exa Answer API plumbing shared by the enrichment scripts.
+
+ExaClient POSTs to /answer over one keep-alive HTTPS connection per worker
+thread. It can optionally pace request starts across threads and retry
+rate-limit and server errors with backoff. Also here: the JSON codec
+(orjson when installed), body_tail for request bodies, and submit_in_order
+and lookup_in_order for pipelined lookups.
+"""
+
+from __future__ import annotations
+
+import collections
+import http.client
+import json
+import random
+import threading
+import time
+from concurrent.futures import Executor
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib codec
+    orjson = None
+
+if orjson:
+    json_dumps, json_loads = orjson.dumps, orjson.loads
+else:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    json_loads = json.loads
+
+EXA_HOST = "api.exa.ai"
+MAX_RETRIES = 3  # Extra attempts for a 429/5xx response
+RETRY_BACKOFF = 0.5  # Seconds before the first retry, doubled each time
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimiter:
+    """Space out request starts across worker threads."""
+
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_at - now
+            self.next_at = max(now, self.next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every worker's next request for at least `seconds`."""
+        with self.lock:
+            self.next_at = max(self.next_at, time.monotonic() + seconds)
+
+
+def body_tail(schema: dict, text: bool = True) -> bytes:
+    """The part of an /answer request body after the query, for one output schema.
+
+    Scripts build it once at import; each request body is then
+    b'{"query":' + json_dumps(query) + tail. With text=False the source
+    text is not requested along with the answer.
+    """
+    return (b',"text":true' if text else b"") + b',"outputSchema":' + json_dumps(schema) + b"}"
+
+
+def retry_delay(headers, attempt: int) -> float:
+    """Seconds to hold off after a 429/5xx: the server's Retry-After if it
+    gave one, else exponential backoff, plus a little jitter."""
+    try:
+        delay = float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        delay = RETRY_BACKOFF * 2 ** attempt
+    return delay + random.uniform(0, RETRY_BACKOFF)
+
+
+class ExaClient:
+    """POSTs to Exa's /answer endpoint for one script.
+
+    requests_per_sec, if given, caps request starts across all threads.
+    max_retries is the number of extra attempts for a 429/5xx response;
+    with retry_network_errors, timeouts and dropped connections are retried
+    the same way.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        user_agent: str,
+        requests_per_sec: float | None = None,
+        max_retries: int = MAX_RETRIES,
+        retry_network_errors: bool = False,
+    ):
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": user_agent,
+            "x-api-key": api_key,
+        }
+        self.limiter = RateLimiter(requests_per_sec) if requests_per_sec else None
+        self.max_retries = max_retries
+        self.retry_network_errors = retry_network_errors
+        self._local = threading.local()  # One keep-alive connection per worker thread
+
+    def _post_once(self, body: bytes, timeout: int) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """Send one POST over this thread's connection, reconnecting once if
+        the server has dropped it while idle."""
+        local = self._local
+        for attempt in range(2):
+            conn = getattr(local, "conn", None)
+            if conn is None:
+                conn = local.conn = http.client.HTTPSConnection(EXA_HOST, timeout=timeout)
+            try:
+                conn.request("POST", "/answer", body, self.headers)
+                resp = conn.getresponse()
+                return resp.status, resp.headers, resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                local.conn = None
+                if attempt:
+                    raise
+            except Exception:
+                conn.close()
+                local.conn = None
+                raise
+
+    def _hold_off(self, seconds: float) -> None:
+        if self.limiter:
+            self.limiter.pause(seconds)
+        else:
+            time.sleep(seconds)
+
+    def post_answer(self, body: bytes, timeout: int) -> tuple[int, bytes]:
+        """POST to /answer and return (status, response body).
+
+        Every attempt goes through the rate limiter, if there is one.
+        Retry-After / X-RateLimit-Remaining headers pause all workers, not
+        just the one that hit the limit. A network error that is not
+        retried, or happens on the last attempt, is raised.
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.limiter:
+                self.limiter.wait()
+            try:
+                status, headers, raw = self._post_once(body, timeout)
+            except (OSError, http.client.HTTPException):
+                if not self.retry_network_errors or attempt == self.max_retries:
+                    raise
+                self._hold_off(retry_delay({}, attempt))
+                continue
+            if self.limiter and headers.get("X-RateLimit-Remaining") == "0":
+                self.limiter.pause(RETRY_BACKOFF)
+            if status not in RETRY_STATUSES or attempt == self.max_retries:
+                return status, raw
+            self._hold_off(retry_delay(headers, attempt))
+
+
+def submit_in_order(executor: Executor, fn, items, max_pending: int):
+    """Run fn over items on the executor, yielding (item, result) in input order.
+
+    At most max_pending calls are outstanding at once: a slow call only holds
+    back the items queued behind it rather than a whole window, and memory
+    stays bounded however long the input is.
+    """
+    pending = collections.deque()
+    for item in items:
+        pending.append((item, executor.submit(fn, item)))
+        if len(pending) >= max_pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
+
+def lookup_in_order(executor: Executor, items, key, cached, lookup, finish, batch_size: int, max_pending: int):
+    """Look items up in batches on the executor, yielding (item, result, how) in input order.
+
+    key(item) is the query for an item's person, or "" if there is no one to
+    look up; such items come back as (item, None, None). cached(item, query),
+    if given, returns a stored result or None. The misses are gathered into
+    batches of batch_size, and lookup(batch) runs on the executor. Then
+    finish(batch, answer) turns its answer into one result per item, on the
+    calling thread and in input order. A falsy result means nobody was found.
+
+    how is "cached", "looked up" or "repeat". A person listed more than once
+    is looked up only once, and later items repeat the first one's result.
+    Results found are kept for the rest of the run, so that holds without a
+    cache too. A person whose lookup found nothing is looked up again if
+    they are listed after it is back.
+
+    Items go out in groups that end after batch_size misses or 4 * batch_size
+    items. With a mostly warm cache, results still come back as the input is
+    read rather than held up waiting for a full batch of misses.
+    """
+    group_items = 4 * batch_size
+    found = {}  # Query -> result, None while the lookup is in flight
+
+    def groups():
+        group, batch = [], []
+        for item in items:
+            query = key(item)
+            how = result = None
+            if query in found:
+                how = "repeat"
+            elif query:
+                result = cached(item, query) if cached else None
+                if result is not None:
+                    how = "cached"
+                else:
+                    how = "looked up"
+                    found[query] = None
+                    batch.append(item)
+            group.append((item, query, how, result))
+            if len(batch) == batch_size or len(group) >= group_items:
+                yield group, batch
+                group, batch = [], []
+        if group:
+            yield group, batch
+
+    def run(group_batch):
+        batch = group_batch[1]
+        return lookup(batch) if batch else None
+
+    for (group, batch), answer in submit_in_order(executor, run, groups(), max_pending):
+        results = iter(finish(batch, answer) if batch else ())
+        for item, query, how, result in group:
+            if how == "looked up":
+                result = next(results)
+                if result:
+                    found[query] = result
+                else:
+                    del found[query]
+            elif how == "repeat":
+                # The first item comes earlier in input order, so its result is in by now
+                result = found.get(query)
+            yield item, result, how
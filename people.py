@@ -0,0 +1,56 @@
+"""Batched people lookups shared by enrich_linkedin and enrich_phones.
+
+Both send Exa a list of people, one line each, and get back one result
+per person. Results are matched to their CSV rows by name.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+
+
+def describe_person(row: dict) -> str:
+    """One line per person: name - title - at company - (Instagram: @handle)."""
+    title = row.get("title", "").strip()
+    company = row.get("company", "").strip()
+    instagram = row.get("instagram", "").strip()
+    extras = (
+        title,
+        company and f"at {company}",
+        instagram and f"(Instagram: @{instagram.lstrip('@')})",
+    )
+    return " - ".join([row.get("name", "").strip(), *filter(None, extras)])
+
+
+def build_people_list(rows: list[dict]) -> str:
+    """Build a text list of people from CSV rows."""
+    return "\n".join(map(describe_person, rows))
+
+
+def name_key(name: str) -> str:
+    """Normalize a name for matching: drop accents, punctuation, case and extra spaces."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    kept = "".join(c for c in decomposed if c.isalnum() or c.isspace())
+    return " ".join(kept.casefold().split())
+
+
+def match_results(rows: list[dict], results: list[dict]) -> list[dict | None]:
+    """Match API results back to CSV rows by name: each row's result, or None if it has none."""
+    # Index results by normalized name for fuzzy matching
+    result_map = {key: r for r in results if (key := name_key(r.get("name", "")))}
+    return [result_map.get(name_key(row.get("name", ""))) for row in rows]
+
+
+def report_batch(label: str, batch: list[dict], results: list[dict], show) -> list[dict | None]:
+    """Print a finished batch, each result through show, and return its rows' matches."""
+    names = [r.get("name", "").strip() for r in batch]
+    print(f"[Batch {label}] {', '.join(names)}")
+
+    if not results:
+        print("  No results returned")
+        return [None] * len(batch)
+
+    for r in results:
+        print(f"  {r.get('name', '')}")
+        show(r)
+    return match_results(batch, results)
@@ -0,0 +1,75 @@
+"""--resume support shared by the enrichment scripts.
+
+A resumed run appends to the output CSV an earlier run left behind. It
+skips as many input rows per person as that file already holds. Output
+is written in input order, so those are the rows the earlier run did
+first.
+"""
+
+from __future__ import annotations
+
+import collections
+import csv
+import os
+from collections.abc import Callable
+
+
+def load_done_keys(path: str, key_cols, key: Callable[[dict], str]) -> collections.Counter[str]:
+    """Count the rows per key that an earlier run wrote to the CSV at path.
+
+    key is called on a dict of just the key_cols cells of each row. The file
+    is then cut back to the end of its last complete row. An interrupted run
+    can leave a row half-written with no line terminator, and appending
+    after it would glue the next row onto the fragment. Such a row is not
+    counted, so that person is redone. Neither is a terminated row with the
+    wrong number of cells.
+    """
+    done = collections.Counter()
+    if not os.path.exists(path):
+        return done
+
+    pos, terminated = 0, True  # Bytes read so far; whether the last line read was complete
+
+    with open(path, newline="", encoding="utf-8") as f:
+        def lines():
+            nonlocal pos, terminated
+            for line in f:
+                pos += len(line.encode("utf-8"))
+                terminated = line.endswith(("\n", "\r"))
+                yield line
+
+        reader = csv.reader(lines())
+        complete = 0  # Byte offset just past the last row that ended with a line terminator
+        try:
+            header = next(reader, [])
+            if header and terminated:
+                complete = pos
+                cols = [(col, header.index(col)) for col in key_cols if col in header]
+                width = len(header)
+                for row in reader:
+                    if not terminated:
+                        break
+                    complete = pos
+                    if len(row) == width:
+                        done[key({col: row[i] for col, i in cols})] += 1
+        except csv.Error:  # A quoted cell cut off at the end of the file
+            pass
+
+    if complete < os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(complete)
+    return done
+
+
+def skip_done(rows, done: collections.Counter[str], key: Callable[[dict], str]):
+    """Yield the input rows still to do, passing over the first done[k] rows with each key k.
+
+    Only that many rows per key are skipped. A person listed more than once
+    whose later rows were not written yet still has those rows processed.
+    """
+    for row in rows:
+        k = key(row)
+        if done[k]:
+            done[k] -= 1
+        else:
+            yield row
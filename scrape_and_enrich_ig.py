@@ -5,6 +5,9 @@ Usage:
     python3 scrape_and_enrich_ig.py <target_account> --ig-user <your_ig_username> --ig-pass <your_ig_password>
     python3 scrape_and_enrich_ig.py <target_account> --ig-user <email> --ig-pass <pass> --limit 5 --skip-enrich
 
+The login session is saved to ~/.cache/ig_state_<ig_user>.json and reused on
+later runs with the same --ig-user (delete the file to force a fresh login).
+
 Requires: pip install playwright && python -m playwright install chromium
 """
 
@@ -14,18 +17,23 @@ import argparse
 import csv
 import json
 import os
+import re
 import sys
 import time
-import urllib.request
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from exa_client import ExaClient, body_tail, json_dumps, json_loads
 
-# Flush print output immediately (for background runs)
-print = lambda *a, **k: __builtins__.__dict__["print"](*a, **k, flush=True)  # noqa: A001
+# Flush each line immediately (for background runs)
+sys.stdout.reconfigure(line_buffering=True)
 
 # ---------------------------------------------------------------------------
 # Exa config
 # ---------------------------------------------------------------------------
 
 EXA_API_KEY = os.environ.get("EXA_API_KEY")
+REQUESTS_PER_SEC = 2.0  # Cap on API call starts across all enrichment workers
 
 OUTPUT_SCHEMA = {
     "type": "object",
@@ -54,15 +62,36 @@ OUTPUT_SCHEMA = {
     "required": ["linkedin", "email", "phone_number", "role", "company"],
 }
 
+_BODY_TAIL = body_tail(OUTPUT_SCHEMA)
+
 EMPTY_ENRICHMENT = {"linkedin": "", "email": "", "phone_number": "", "role": "", "company": ""}
 
 # ---------------------------------------------------------------------------
 # Step 1 — Scrape followers with Playwright
 # ---------------------------------------------------------------------------
 
+IG_STATE_DIR = os.path.expanduser("~/.cache")  # Saved login cookies, one file per account, reused across runs
+API_PAGE_SIZE = 200  # Followers requested per friendships API page
+
 
-def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None) -> list[dict]:
-    """Scrape followers using Playwright browser automation."""
+def ig_state_path(ig_user: str) -> str:
+    """Where the login session for ig_user is saved."""
+    account = re.sub(r"[^\w.@+-]", "_", ig_user.strip().lower())
+    return os.path.join(IG_STATE_DIR, f"ig_state_{account}.json")
+
+
+def scrape_followers(
+    target: str,
+    ig_user: str,
+    ig_pass: str,
+    limit: int | None,
+    on_new: Callable[[dict], None] | None = None,
+) -> list[dict]:
+    """Scrape followers using Playwright browser automation.
+
+    on_new, if given, is called with each follower as soon as it is found, so
+    the caller can start work on it while the scrape is still scrolling.
+    """
     try:
         from playwright.sync_api import sync_playwright
     except ImportError:
@@ -72,59 +101,153 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
 
     followers = []
     seen_usernames = set()
+    state_path = ig_state_path(ig_user)
+    target_count = limit or 999999  # Every collection loop stops adding at this many
+
+    def add_follower(follower: dict) -> None:
+        followers.append(follower)
+        if on_new:
+            on_new(follower)
 
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
-        context = browser.new_context(viewport={"width": 1280, "height": 900})
+        # Reuse the session saved by an earlier run so the login flow can be skipped
+        context_kwargs = {"viewport": {"width": 1280, "height": 900}}
+        if os.path.exists(state_path):
+            context_kwargs["storage_state"] = state_path
+        context = browser.new_context(**context_kwargs)
+
+        # Page-side helpers for the dialog-scroll fallback, installed once per
+        # document so each scroll tick sends a short call instead of the whole
+        # script. The follower collector remembers the usernames it has already
+        # returned, so each tick only ships the new entries back to Python.
+        context.add_init_script("""
+            window.__collectFollowers = (() => {
+                const seen = new Set();
+                const re = /^\\/([a-zA-Z0-9._]+)\\/$/;
+                const skip = new Set(["explore", "reels", "direct", "accounts", "p", "stories"]);
+                return () => {
+                    const dialog = document.querySelector("div[role='dialog']");
+                    if (!dialog) return [];
+                    const fresh = [];
+                    for (const link of dialog.querySelectorAll("a[href^='/']")) {
+                        const m = re.exec(link.getAttribute("href") || "");
+                        if (!m || seen.has(m[1]) || skip.has(m[1])) continue;
+                        seen.add(m[1]);
+                        fresh.push(m[1]);
+                    }
+                    return fresh;
+                };
+            })();
+
+            // Tag the tallest scrollable div in the followers dialog as the scroller
+            window.__findScroller = () => {
+                const dialog = document.querySelector("div[role='dialog']");
+                if (!dialog) return null;
+                // Find the deepest scrollable div inside the dialog
+                let best = null;
+                let bestHeight = 0;
+                const divs = dialog.querySelectorAll("div");
+                for (const div of divs) {
+                    const overflow = window.getComputedStyle(div).overflowY;
+                    if ((overflow === 'auto' || overflow === 'scroll' || overflow === 'hidden')
+                        && div.scrollHeight > div.clientHeight + 10) {
+                        if (div.scrollHeight > bestHeight) {
+                            bestHeight = div.scrollHeight;
+                            best = div;
+                        }
+                    }
+                }
+                if (best) {
+                    best.setAttribute('data-follower-scroller', 'true');
+                    return { scrollHeight: best.scrollHeight, clientHeight: best.clientHeight, scrollTop: best.scrollTop };
+                }
+                return null;
+            };
+
+            // Scroll the tagged container (or any scrollable dialog div) by `amount`
+            window.__scroll = (amount) => {
+                const el = document.querySelector("[data-follower-scroller='true']");
+                if (el) {
+                    el.scrollTop += amount;
+                    return { scrollTop: el.scrollTop, scrollHeight: el.scrollHeight, clientHeight: el.clientHeight };
+                }
+                // Fallback: scroll any scrollable div in dialog
+                const dialog = document.querySelector("div[role='dialog']");
+                if (!dialog) return null;
+                const divs = dialog.querySelectorAll("div");
+                for (const div of divs) {
+                    if (div.scrollHeight > div.clientHeight + 50) {
+                        div.scrollTop += amount;
+                        return { scrollTop: div.scrollTop, scrollHeight: div.scrollHeight, clientHeight: div.clientHeight };
+                    }
+                }
+                return null;
+            };
+
+            window.__scrollToEnd = () => {
+                const el = document.querySelector("[data-follower-scroller='true']");
+                if (el) el.scrollTop = el.scrollHeight;
+            };
+        """)
         page = context.new_page()
 
         # --- Login ---
+        # A still-valid saved session redirects straight off the login page
         print("Logging into Instagram...")
         page.goto("https://www.instagram.com/accounts/login/", wait_until="domcontentloaded")
         time.sleep(5)
 
-        # Accept cookies if banner appears
-        try:
-            page.get_by_role("button", name="Allow all cookies").click(timeout=3000)
-            time.sleep(1)
-        except Exception:
+        if "/accounts/login" not in page.url:
+            print(f"Reusing saved session from {state_path}")
+        else:
+            # Accept cookies if banner appears
             try:
-                page.get_by_role("button", name="Accept").click(timeout=2000)
+                page.get_by_role("button", name="Allow all cookies").click(timeout=3000)
                 time.sleep(1)
             except Exception:
-                pass
+                try:
+                    page.get_by_role("button", name="Accept").click(timeout=2000)
+                    time.sleep(1)
+                except Exception:
+                    pass
 
-        # Wait for login form to appear
-        page.get_by_role("textbox", name="Mobile number, username or").wait_for(timeout=15000)
+            # Wait for login form to appear
+            page.get_by_role("textbox", name="Mobile number, username or").wait_for(timeout=15000)
 
-        # Fill login form using role-based selectors (from snapshot)
-        page.get_by_role("textbox", name="Mobile number, username or").fill(ig_user)
-        page.get_by_role("textbox", name="Password").fill(ig_pass)
-        page.get_by_role("button", name="Log in", exact=True).click()
-        print("Submitted login...")
+            # Fill login form using role-based selectors (from snapshot)
+            page.get_by_role("textbox", name="Mobile number, username or").fill(ig_user)
+            page.get_by_role("textbox", name="Password").fill(ig_pass)
+            page.get_by_role("button", name="Log in", exact=True).click()
+            print("Submitted login...")
 
-        # Wait for navigation away from login page (flexible — may go to onetap, feed, or challenge)
-        page.wait_for_function(
-            """() => !window.location.pathname.includes('/accounts/login')""",
-            timeout=30000,
-        )
-        print(f"Login successful! (redirected to {page.url})")
+            # Wait for navigation away from login page (flexible — may go to onetap, feed, or challenge)
+            page.wait_for_function(
+                """() => !window.location.pathname.includes('/accounts/login')""",
+                timeout=30000,
+            )
+            print(f"Login successful! (redirected to {page.url})")
 
-        # Dismiss "Save Login Info" dialog
-        try:
-            page.get_by_role("button", name="Not now").click(timeout=5000)
-        except Exception:
+            # Dismiss "Save Login Info" dialog
+            try:
+                page.get_by_role("button", name="Not now").click(timeout=5000)
+            except Exception:
+                try:
+                    page.get_by_role("button", name="Not Now").click(timeout=3000)
+                except Exception:
+                    pass
+            time.sleep(2)
+
+            # Dismiss "Turn on Notifications" if it appears
             try:
                 page.get_by_role("button", name="Not Now").click(timeout=3000)
             except Exception:
                 pass
-        time.sleep(2)
 
-        # Dismiss "Turn on Notifications" if it appears
-        try:
-            page.get_by_role("button", name="Not Now").click(timeout=3000)
-        except Exception:
-            pass
+            # Save the session so later runs skip this login flow
+            os.makedirs(IG_STATE_DIR, exist_ok=True)
+            context.storage_state(path=state_path)
+            os.chmod(state_path, 0o600)
 
         # --- Navigate to target profile ---
         print(f"Navigating to @{target}...")
@@ -132,7 +255,6 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
         time.sleep(3)
 
         # --- Set up network response listener to capture follower data ---
-        target_count = limit or 999999
         captured_queue = []
 
         def on_response(response):
@@ -205,7 +327,9 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
             api_stall = 0
             while len(followers) < target_count:
                 try:
-                    url = f"https://www.instagram.com/api/v1/friendships/{user_id}/followers/?count=50&max_id={max_id}"
+                    # Ask for no more than the limit still needs
+                    count = min(API_PAGE_SIZE, target_count - len(followers))
+                    url = f"https://www.instagram.com/api/v1/friendships/{user_id}/followers/?count={count}&max_id={max_id}"
                     api_result = page.evaluate(f"""
                         async () => {{
                             try {{
@@ -236,6 +360,10 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
                     if not api_result or "error" in api_result:
                         err = api_result.get("error", "unknown") if api_result else "null response"
                         print(f"    API error: {err}")
+                        if err in (401, 403):
+                            # Not allowed to list this account's followers; retrying won't help
+                            print("    Follower API not permitted, falling back to dialog scroll...")
+                            break
                         api_stall += 1
                         if api_stall >= 5:
                             print("    Too many API errors, falling back to dialog scroll...")
@@ -248,12 +376,15 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
                         print("    No users in response, may have reached the end.")
                         break
 
+                    prev_count = len(followers)
                     for u in users:
+                        if len(followers) >= target_count:
+                            break
                         username = u.get("username", "")
                         if not username or username in seen_usernames or username == target:
                             continue
                         seen_usernames.add(username)
-                        followers.append({
+                        add_follower({
                             "username": username,
                             "full_name": u.get("full_name", ""),
                             "biography": "",
@@ -266,10 +397,10 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
                     next_max_id = api_result.get("next_max_id", "")
                     big_list = api_result.get("big_list", False)
 
-                    if len(followers) % 500 < 50:
+                    if len(followers) // 500 > prev_count // 500:
                         print(f"  ... {len(followers)} collected via API")
 
-                    if len(followers) % 2000 < 50:
+                    if len(followers) // 2000 > prev_count // 2000:
                         # Save progress
                         progress_path = f"{target}_followers_progress.csv"
                         try:
@@ -311,57 +442,9 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
 
         print(f"Collecting followers via dialog scroll (limit: {limit or 'all'})...")
 
-        # Find the scrollable container inside the dialog via JS
-        # and cache a reference to it for efficient scrolling
-        _find_scroller_js = """
-            () => {
-                const dialog = document.querySelector("div[role='dialog']");
-                if (!dialog) return null;
-                // Find the deepest scrollable div inside the dialog
-                let best = null;
-                let bestHeight = 0;
-                const divs = dialog.querySelectorAll("div");
-                for (const div of divs) {
-                    const overflow = window.getComputedStyle(div).overflowY;
-                    if ((overflow === 'auto' || overflow === 'scroll' || overflow === 'hidden')
-                        && div.scrollHeight > div.clientHeight + 10) {
-                        if (div.scrollHeight > bestHeight) {
-                            bestHeight = div.scrollHeight;
-                            best = div;
-                        }
-                    }
-                }
-                if (best) {
-                    best.setAttribute('data-follower-scroller', 'true');
-                    return { scrollHeight: best.scrollHeight, clientHeight: best.clientHeight, scrollTop: best.scrollTop };
-                }
-                return null;
-            }
-        """
-
-        _scroll_js = """
-            (amount) => {
-                const el = document.querySelector("[data-follower-scroller='true']");
-                if (el) {
-                    el.scrollTop += amount;
-                    return { scrollTop: el.scrollTop, scrollHeight: el.scrollHeight, clientHeight: el.clientHeight };
-                }
-                // Fallback: scroll any scrollable div in dialog
-                const dialog = document.querySelector("div[role='dialog']");
-                if (!dialog) return null;
-                const divs = dialog.querySelectorAll("div");
-                for (const div of divs) {
-                    if (div.scrollHeight > div.clientHeight + 50) {
-                        div.scrollTop += amount;
-                        return { scrollTop: div.scrollTop, scrollHeight: div.scrollHeight, clientHeight: div.clientHeight };
-                    }
-                }
-                return null;
-            }
-        """
-
-        # Initialize scroller reference
-        scroller_info = page.evaluate(_find_scroller_js)
+        # Find the scrollable container inside the dialog and tag it so later
+        # scroll calls can go straight to it
+        scroller_info = page.evaluate("() => window.__findScroller()")
         if scroller_info:
             print(f"  Scroller found: height={scroller_info['scrollHeight']}, viewport={scroller_info['clientHeight']}")
         else:
@@ -377,13 +460,13 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
         def _process_queue():
             """Process captured network data into followers list."""
             added = 0
-            while captured_queue:
+            while captured_queue and len(followers) < target_count:
                 entry = captured_queue.pop(0)
                 username = entry.get("username", "")
                 if not username or username in seen_usernames or username == target:
                     continue
                 seen_usernames.add(username)
-                followers.append({
+                add_follower({
                     "username": username,
                     "full_name": entry.get("full_name", ""),
                     "biography": "",
@@ -401,29 +484,14 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
             """Scan DOM for usernames as fallback."""
             added = 0
             try:
-                dom_entries = page.evaluate("""
-                    () => {
-                        const dialog = document.querySelector("div[role='dialog']");
-                        if (!dialog) return [];
-                        const results = [];
-                        const links = dialog.querySelectorAll("a[href^='/']");
-                        for (const link of links) {
-                            const href = link.getAttribute("href") || "";
-                            if (!href.match(/^\\/[a-zA-Z0-9._]+\\/$/)) continue;
-                            const username = href.replace(/\\//g, "");
-                            const skip = ["explore", "reels", "direct", "accounts", "p", "stories"];
-                            if (skip.includes(username)) continue;
-                            results.push({ username });
-                        }
-                        return results;
-                    }
-                """)
-                for entry in dom_entries:
-                    username = entry["username"]
+                new_usernames = page.evaluate("() => window.__collectFollowers ? window.__collectFollowers() : []")
+                for username in new_usernames:
+                    if len(followers) >= target_count:
+                        break
                     if username in seen_usernames or username == target:
                         continue
                     seen_usernames.add(username)
-                    followers.append({
+                    add_follower({
                         "username": username, "full_name": "", "biography": "",
                         "external_url": "", "followers_count": "",
                         "is_verified": False, "is_business_account": False,
@@ -465,15 +533,10 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
                         page.get_by_role("link", name="followers").click()
                         time.sleep(4)
                         # Re-find scroller
-                        scroller_info = page.evaluate(_find_scroller_js)
+                        scroller_info = page.evaluate("() => window.__findScroller()")
                         if scroller_info:
                             # Scroll back to bottom quickly
-                            page.evaluate("""
-                                () => {
-                                    const el = document.querySelector("[data-follower-scroller='true']");
-                                    if (el) el.scrollTop = el.scrollHeight;
-                                }
-                            """)
+                            page.evaluate("() => window.__scrollToEnd()")
                             time.sleep(3)
                         no_new_count = 10  # Give it more chances after recovery
                     except Exception as e:
@@ -488,14 +551,9 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
                         time.sleep(3)
                         page.get_by_role("link", name="followers").click()
                         time.sleep(4)
-                        scroller_info = page.evaluate(_find_scroller_js)
+                        scroller_info = page.evaluate("() => window.__findScroller()")
                         if scroller_info:
-                            page.evaluate("""
-                                () => {
-                                    const el = document.querySelector("[data-follower-scroller='true']");
-                                    if (el) el.scrollTop = el.scrollHeight;
-                                }
-                            """)
+                            page.evaluate("() => window.__scrollToEnd()")
                             time.sleep(3)
                         no_new_count = 20  # Reset partially
                     except Exception as e:
@@ -519,16 +577,16 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
 
             # Scroll: use JS scroll on the identified container + mouse wheel combo
             try:
-                scroll_result = page.evaluate(_scroll_js, 800)
+                scroll_result = page.evaluate("(amount) => window.__scroll(amount)", 800)
                 if scroll_result:
                     at_bottom = scroll_result["scrollTop"] + scroll_result["clientHeight"] >= scroll_result["scrollHeight"] - 5
                     if at_bottom:
                         # At the bottom — wait for more content to load
                         time.sleep(3)
                         # Small reverse scroll + re-scroll to trigger loading
-                        page.evaluate(_scroll_js, -200)
+                        page.evaluate("(amount) => window.__scroll(amount)", -200)
                         time.sleep(0.5)
-                        page.evaluate(_scroll_js, 400)
+                        page.evaluate("(amount) => window.__scroll(amount)", 400)
                         time.sleep(2)
                     else:
                         time.sleep(1.5)
@@ -557,6 +615,8 @@ def scrape_followers(target: str, ig_user: str, ig_pass: str, limit: int | None)
 # Step 2 — Enrich via Exa
 # ---------------------------------------------------------------------------
 
+exa = ExaClient(EXA_API_KEY or "", "ig-enrich/1.0", REQUESTS_PER_SEC)
+
 
 def enrich_follower(follower: dict) -> dict:
     """Use Exa Answer API to find LinkedIn, email, phone for a follower."""
@@ -581,30 +641,15 @@ def enrich_follower(follower: dict) -> dict:
 
     query = " ".join(lines)
 
-    body = json.dumps({
-        "query": query,
-        "text": True,
-        "outputSchema": OUTPUT_SCHEMA,
-    }).encode()
-
-    req = urllib.request.Request(
-        "https://api.exa.ai/answer",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "ig-enrich/1.0",
-            "x-api-key": EXA_API_KEY,
-        },
-    )
+    body = b'{"query":' + json_dumps(query) + _BODY_TAIL
 
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        err_body = e.read().decode()
-        print(f"    API error ({e.code}): {err_body[:200]}")
-        return EMPTY_ENRICHMENT.copy()
+        status, raw = exa.post_answer(body, timeout=30)
+        if status >= 400:
+            err_body = raw.decode(errors="replace")
+            print(f"    API error ({status}): {err_body[:200]}")
+            return EMPTY_ENRICHMENT.copy()
+        data = json_loads(raw)
     except Exception as e:
         print(f"    Request failed: {e}")
         return EMPTY_ENRICHMENT.copy()
@@ -613,7 +658,7 @@ def enrich_follower(follower: dict) -> dict:
 
     if isinstance(answer, str):
         try:
-            answer = json.loads(answer)
+            answer = json_loads(answer)
         except (json.JSONDecodeError, TypeError):
             return EMPTY_ENRICHMENT.copy()
 
@@ -658,79 +703,99 @@ def main():
     parser.add_argument("--skip-enrich", action="store_true", help="Skip Exa enrichment, just scrape")
     parser.add_argument("--output", default=None, help="Output CSV path")
     parser.add_argument("--resume", default=None, help="Resume from a previous progress CSV (merge new followers)")
+    parser.add_argument("--workers", type=int, default=8, help="Enrichment lookups in flight at once (default: 8)")
     args = parser.parse_args()
 
     output_path = args.output or f"{args.target}_followers.csv"
+    enrich = not args.skip_enrich and bool(EXA_API_KEY)
+    if not args.skip_enrich and not EXA_API_KEY:
+        print("Warning: EXA_API_KEY not set. Skipping enrichment.")
 
-    # --- Scrape ---
-    followers = scrape_followers(args.target, args.ig_user, args.ig_pass, args.limit)
-
-    # Merge with previous progress CSV if --resume is given
+    existing = []
     if args.resume and os.path.exists(args.resume):
-        print(f"\nMerging with previous data from {args.resume}...")
         with open(args.resume, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            existing = list(reader)
-        existing_usernames = {r["username"] for r in existing}
-        new_count = 0
-        for f_row in followers:
-            if f_row["username"] not in existing_usernames:
-                existing.append(f_row)
-                new_count += 1
-        followers = existing
-        print(f"Merged: {len(existing) - new_count} existing + {new_count} new = {len(followers)} total")
-
-    if not followers:
-        print("No followers found.")
-        return
-
-    # Save raw follower data immediately
-    raw_path = output_path.replace(".csv", "_raw.csv")
-    save_csv(followers, raw_path)
-
-    if args.skip_enrich:
-        save_csv(followers, output_path)
-        print(f"\nDone! {len(followers)} followers scraped (enrichment skipped).")
-        return
-
-    # --- Enrich ---
-    if not EXA_API_KEY:
-        print("\nWarning: EXA_API_KEY not set. Skipping enrichment.")
-        save_csv(followers, output_path)
-        return
-
-    print(f"\nEnriching {len(followers)} followers via Exa...\n")
+            existing = list(csv.DictReader(f))
+    existing_usernames = {r["username"] for r in existing}
 
     enriched_count = 0
-    for i, follower in enumerate(followers):
-        name = follower.get("full_name") or follower["username"]
-        label = f"@{follower['username']}"
-        if follower["full_name"]:
-            label += f" ({follower['full_name']})"
-        print(f"[{i + 1}/{len(followers)}] {label}")
-
-        result = enrich_follower(follower)
-        follower.update(result)
-
-        found_items = []
-        if result["linkedin"]:
-            found_items.append(f"LI: {result['linkedin']}")
-        if result["email"]:
-            found_items.append(f"email: {result['email']}")
-        if result["phone_number"]:
-            found_items.append(f"phone: {result['phone_number']}")
-        if result["role"] or result["company"]:
-            role_str = " ".join(filter(None, [result["role"], f"@ {result['company']}" if result["company"] else ""]))
-            found_items.append(role_str)
-
-        if found_items:
-            enriched_count += 1
-            print(f"    {' | '.join(found_items)}")
-        else:
-            print(f"    no data found")
-
-        if i < len(followers) - 1:
-            time.sleep(0.75)
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        # Lookups start as each follower is scraped, so the Exa calls run
+        # during the scroll and page waits instead of after them. Followers
+        # already in the --resume file are merged in (and submitted) once the
+        # scrape is done.
+        futures = {}
+
+        def submit(follower: dict) -> None:
+            if enrich and follower["username"] not in existing_usernames:
+                futures[executor.submit(enrich_follower, follower)] = follower
+
+        # --- Scrape ---
+        try:
+            followers = scrape_followers(args.target, args.ig_user, args.ig_pass, args.limit, on_new=submit)
+        except BaseException:
+            # The results would be thrown away, so drop the lookups still
+            # queued rather than letting the executor's exit run them all
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        # Merge with previous progress CSV if --resume is given
+        if existing:
+            print(f"\nMerging with previous data from {args.resume}...")
+            new_count = 0
+            for f_row in followers:
+                if f_row["username"] not in existing_usernames:
+                    existing.append(f_row)
+                    new_count += 1
+            followers = existing
+            print(f"Merged: {len(existing) - new_count} existing + {new_count} new = {len(followers)} total")
+            if enrich:
+                for f_row in followers[:len(followers) - new_count]:
+                    futures[executor.submit(enrich_follower, f_row)] = f_row
+
+        if not followers:
+            print("No followers found.")
+            return
+
+        # Save raw follower data immediately
+        raw_path = output_path.replace(".csv", "_raw.csv")
+        save_csv(followers, raw_path)
+
+        if not enrich:
+            save_csv(followers, output_path)
+            print(f"\nDone! {len(followers)} followers scraped (enrichment skipped).")
+            return
+
+        # --- Enrich ---
+        done = sum(future.done() for future in futures)
+        print(f"\nEnriching {len(followers)} followers via Exa ({args.workers} workers, {done} already done)...\n")
+
+        position = {id(follower): i for i, follower in enumerate(followers)}
+        for future in as_completed(futures):
+            follower = futures[future]
+            label = f"@{follower['username']}"
+            if follower["full_name"]:
+                label += f" ({follower['full_name']})"
+            print(f"[{position[id(follower)] + 1}/{len(followers)}] {label}")
+
+            result = future.result()
+            follower.update(result)
+
+            found_items = []
+            if result["linkedin"]:
+                found_items.append(f"LI: {result['linkedin']}")
+            if result["email"]:
+                found_items.append(f"email: {result['email']}")
+            if result["phone_number"]:
+                found_items.append(f"phone: {result['phone_number']}")
+            if result["role"] or result["company"]:
+                role_str = " ".join(filter(None, [result["role"], f"@ {result['company']}" if result["company"] else ""]))
+                found_items.append(role_str)
+
+            if found_items:
+                enriched_count += 1
+                print(f"    {' | '.join(found_items)}")
+            else:
+                print(f"    no data found")
 
     # Save enriched CSV
     save_csv(followers, output_path)
@@ -0,0 +1,24 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+# The scripts live at the repo root rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def load_script(monkeypatch, tmp_path):
+    """Import a script module afresh with the given command line, run from tmp_path.
+
+    The scripts parse their arguments at import, so each test gets its own copy.
+    """
+    def load(name, *argv):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("EXA_API_KEY", "test")
+        monkeypatch.setattr(sys, "argv", [f"{name}.py", *argv])
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        return importlib.import_module(name)
+
+    return load
@@ -0,0 +1,21 @@
+import pytest
+
+from clean_csv import clean_full_name
+
+
+@pytest.mark.parametrize("name", [
+    "Jane DoeVerified",
+    "Jane Doe Verified",
+    "Jane Doe ✓ Verified",
+    "Jane Doe Verified ✓",
+    "Jane Doe · Verified",
+    "Jane Doe (Verified)",
+    "Jane Doe Verified  ",
+])
+def test_clean_full_name_strips_verified_badge(name):
+    assert clean_full_name(name) == "Jane Doe"
+
+
+@pytest.mark.parametrize("name", ["Jane Doe", "", "Verified Plumbing Co", "Jane ✓ Doe"])
+def test_clean_full_name_leaves_other_names(name):
+    assert clean_full_name(name) == name
@@ -0,0 +1,58 @@
+import csv
+
+
+def fake_enrich_batch(calls):
+    def enrich_batch(rows):
+        calls.extend(row["name"] for row in rows)
+        return [
+            {"name": row["name"], "phone_number": "1", "email": f"{row['name']}@x.io", "source": "https://example.org"}
+            for row in rows
+        ]
+
+    return enrich_batch
+
+
+def test_resume_after_a_row_cut_off_mid_cell(monkeypatch, tmp_path, load_script):
+    (tmp_path / "in.csv").write_text(
+        "name,title,company,instagram\n"
+        "Alice,Dev,Acme,alice\n"
+        "Bob,PM,Beta,bob\n"
+        "Alice,Dev,Acme,alice\n"
+        "Carol,CTO,Gamma,carol\n",
+        encoding="utf-8",
+    )
+    phones = load_script("enrich_phones", "in.csv", "full.csv", "--no-cache")
+    monkeypatch.setattr(phones, "enrich_batch", fake_enrich_batch([]))
+    phones.main()
+    full = (tmp_path / "full.csv").read_bytes()
+
+    # An interrupted run: Alice's row is written, Bob's stops partway
+    # through its last cell, with no line terminator
+    cut = full.index(b"Bob") + len(b"Bob,PM,Beta,bob,1,Bob@x.io,https://ex")
+    (tmp_path / "out.csv").write_bytes(full[:cut])
+
+    calls = []
+    phones = load_script("enrich_phones", "in.csv", "out.csv", "--no-cache", "--resume")
+    monkeypatch.setattr(phones, "enrich_batch", fake_enrich_batch(calls))
+    phones.main()
+
+    assert (tmp_path / "out.csv").read_bytes() == full
+    assert calls == ["Bob", "Alice", "Carol"]
+
+
+def test_no_cache_repeat_after_its_batch_is_back(monkeypatch, tmp_path, load_script):
+    # Alice's batch is written out before her second row is read
+    others = [f"P{i},,,p{i}\n" for i in range(14)]
+    (tmp_path / "in.csv").write_text(
+        "name,title,company,instagram\nAlice,Dev,Acme,alice\n" + "".join(others) + "Alice,Dev,Acme,alice\n",
+        encoding="utf-8",
+    )
+    calls = []
+    phones = load_script("enrich_phones", "in.csv", "out.csv", "--no-cache", "--workers", "1")
+    monkeypatch.setattr(phones, "enrich_batch", fake_enrich_batch(calls))
+    phones.main()
+
+    assert calls.count("Alice") == 1
+    with open(tmp_path / "out.csv", newline="", encoding="utf-8") as f:
+        emails = [row["email"] for row in csv.DictReader(f) if row["name"] == "Alice"]
+    assert emails == ["Alice@x.io", "Alice@x.io"]
@@ -0,0 +1,44 @@
+import collections
+
+from resume import load_done_keys, skip_done
+
+
+def name_key(row):
+    return row.get("name", "")
+
+
+def test_load_done_keys_counts_repeats(tmp_path):
+    path = tmp_path / "out.csv"
+    path.write_bytes(b"name,note\r\nAlice,x\r\nBob,y\r\nAlice,z\r\n")
+    assert load_done_keys(str(path), ("name",), name_key) == {"Alice": 2, "Bob": 1}
+    assert path.read_bytes() == b"name,note\r\nAlice,x\r\nBob,y\r\nAlice,z\r\n"
+
+
+def test_load_done_keys_drops_an_unterminated_last_row(tmp_path):
+    path = tmp_path / "out.csv"
+    path.write_bytes(b"name,note\r\nAlice,x\r\nBob,y")
+    assert load_done_keys(str(path), ("name",), name_key) == {"Alice": 1}
+    assert path.read_bytes() == b"name,note\r\nAlice,x\r\n"
+
+
+def test_load_done_keys_drops_a_quoted_cell_cut_after_a_newline(tmp_path):
+    path = tmp_path / "out.csv"
+    path.write_bytes('name,note\r\nZoë,x\r\nBob,"line one\r\nline'.encode("utf-8"))
+    assert load_done_keys(str(path), ("name",), name_key) == {"Zoë": 1}
+    assert path.read_bytes() == "name,note\r\nZoë,x\r\n".encode("utf-8")
+
+
+def test_load_done_keys_skips_short_rows(tmp_path):
+    path = tmp_path / "out.csv"
+    path.write_bytes(b"name,note\r\nAlice\r\nBob,y\r\n")
+    assert load_done_keys(str(path), ("name",), name_key) == {"Bob": 1}
+
+
+def test_load_done_keys_missing_file(tmp_path):
+    assert load_done_keys(str(tmp_path / "none.csv"), ("name",), name_key) == {}
+
+
+def test_skip_done_keeps_later_repeats():
+    rows = [{"name": n} for n in ("Alice", "Bob", "Alice", "Carol")]
+    done = collections.Counter({"Alice": 1, "Bob": 1})
+    assert [r["name"] for r in skip_done(rows, done, name_key)] == ["Alice", "Carol"]
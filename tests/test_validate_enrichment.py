@@ -0,0 +1,31 @@
+import csv
+
+
+def test_blank_lines_keep_suspect_rows_in_place(monkeypatch, tmp_path, load_script):
+    (tmp_path / "in.csv").write_text(
+        "name,email,phone_number,phone_source\n"
+        "Alice,a@x.io,+1 254 504 1792,https://alice.me\n"
+        "\n"
+        "Bob,b@x.io,+1 254 504 1795,https://x.com/contact-us\n"
+        "\n"
+        "Carol,c@x.io,+1 254 504 1796,https://x.com/contact\n"
+        "Dan,d@x.io,+1 254 504 1797,https://dan.me\n",
+        encoding="utf-8",
+    )
+    validator = load_script("validate_enrichment", "in.csv", "out.csv", "--no-cache", "--quiet")
+
+    def reject_all(suspects):
+        return [{"is_valid": False, "reason": f"not {fields[0]}", "corrected_phone": ""} for fields in suspects]
+
+    monkeypatch.setattr(validator, "verify_batch", reject_all)
+    validator.main()
+
+    with open(tmp_path / "out.csv", newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["name"], r["phone_status"], r["phone_number"]) for r in rows] == [
+        ("Alice", "ok", "+1 254 504 1792"),
+        ("Bob", "rejected", ""),
+        ("Carol", "rejected", ""),
+        ("Dan", "ok", "+1 254 504 1797"),
+    ]
+    assert rows[1]["phone_review_note"] == "Rejected: not Bob"
@@ -4,22 +4,50 @@
 Flags suspicious phone numbers, removes bad data, and adds a quality score.
 """
 
+from __future__ import annotations
+
+import argparse
 import csv
-import io
+import functools
+import itertools
 import json
 import os
 import re
 import sys
-import time
-import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from cache import CACHE_PATH, ExaCache
+from exa_client import ExaClient, body_tail, json_dumps, json_loads, submit_in_order
 
 EXA_API_KEY = os.environ.get("EXA_API_KEY")
 if not EXA_API_KEY:
     print("Error: EXA_API_KEY environment variable not set")
     sys.exit(1)
 
-INPUT_CSV = sys.argv[1] if len(sys.argv) > 1 else "us_superhuman_users_enriched.csv"
-OUTPUT_CSV = sys.argv[2] if len(sys.argv) > 2 else INPUT_CSV.replace(".csv", "_validated.csv")
+parser = argparse.ArgumentParser(description="Validate enriched phone numbers with heuristics and Exa.")
+parser.add_argument("input_csv", nargs="?", default="us_superhuman_users_enriched.csv", help="Input CSV file")
+parser.add_argument("output_csv", nargs="?", default=None, help="Output CSV path")
+parser.add_argument("--quiet", action="store_true", help="Only print the phase 1 totals, not each flagged row")
+parser.add_argument("--no-cache", action="store_true", help="Ignore cached verdicts and re-verify every suspect")
+parser.add_argument("--batch-size", type=int, default=5, help="Suspects per API call, 1 to disable batching (default: 5)")
+parser.add_argument("--workers", type=int, default=8, help="Verification calls in flight at once (default: 8)")
+parser.add_argument(
+    "--processes", type=int, default=1,
+    help="Processes for the heuristic checks on large files, 1 to stay in-process (default: 1)",
+)
+args = parser.parse_args()
+
+INPUT_CSV = args.input_csv
+OUTPUT_CSV = args.output_csv or INPUT_CSV.replace(".csv", "_validated.csv")
+QUIET = args.quiet
+NO_CACHE = args.no_cache
+CACHE_TABLE = "verify_answers"  # Per-suspect verdicts in the shared Exa cache
+BATCH_SIZE = args.batch_size  # Suspects per API call
+WORKERS = args.workers
+PROCESSES = args.processes
+CHUNK_ROWS = 2000  # Rows per process-pool task; shorter inputs never start the pool
+HEURISTIC_CACHE_SIZE = 1 << 16  # Distinct (phone, source) pairs memoized
+REQUESTS_PER_SEC = 2.0  # Cap on API call starts across all workers
 
 VERIFY_SCHEMA = {
     "type": "object",
@@ -40,24 +68,81 @@ VERIFY_SCHEMA = {
     "required": ["is_valid", "reason", "corrected_phone"],
 }
 
+BATCH_VERIFY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "description": "The number the phone number was listed under.",
+                    },
+                    **VERIFY_SCHEMA["properties"],
+                },
+                "required": ["id", *VERIFY_SCHEMA["required"]],
+            },
+        },
+    },
+    "required": ["results"],
+}
+
+# Only the structured answer is read, so the source text is not requested
+_BODY_TAIL = body_tail(VERIFY_SCHEMA, text=False)
+_BATCH_BODY_TAIL = body_tail(BATCH_VERIFY_SCHEMA, text=False)
+
+VERIFY_HINT = (
+    "check if this phone number is actually theirs, "
+    "or if it's a company main line / wrong person / generic number. "
+    "If you find their real phone number, provide it."
+)
+
+_MASKED = re.compile(r"[Xx*\.]{3,}")  # XXXX, ****, ....
+_FAKE_555 = re.compile(r"555-?\d{4}")
+# Placeholder runs, with or without the dash, as plain substrings
+_PLACEHOLDERS = ("1234567", "123-4567")
+_ZEROS = ("0000000", "000-0000")
+
+# Sources that are a generic company/org page rather than the person's own:
+# matched against the lowercased source, anywhere in it or (for /contact) at
+# the end, where "$" also allowed one trailing newline
+_COMPANY_SUBSTRINGS = (
+    "kroger.com", "fiu.edu", "rit.edu", "utdallas.edu",
+    "fremont.gov", "umich.edu", "stanford.edu",
+    "/contact-us", "/faqs",
+)
+_COMPANY_TAILS = ("/contact", "/contact\n")
+
+
+class _DigitsOnly(dict):
+    """str.translate table keeping only decimal digits (the \\d set), filled lazily."""
+
+    def __missing__(self, code: int) -> int | None:
+        keep = code if chr(code).isdecimal() else None
+        self[code] = keep
+        return keep
+
+
+_KEEP_DIGITS = _DigitsOnly()
+
 
 def heuristic_check(phone: str, name: str, source: str) -> tuple[str, str]:
     """Run heuristic checks on a phone number. Returns (status, reason)."""
     if not phone.strip():
         return ("empty", "no phone")
 
-    cleaned = re.sub(r"[^\dX*x]", "", phone)
-
     # Masked/partial numbers (XXXX, ****, ....)
-    if re.search(r"[Xx*\.]{3,}", phone):
+    if _MASKED.search(phone):
         return ("partial", f"masked/partial number: {phone}")
 
     # 555 fake numbers
-    if re.search(r"555-?\d{4}", phone):
+    if _FAKE_555.search(phone):
         return ("fake", f"likely fake 555 number: {phone}")
 
     # Too short (less than 7 digits)
-    digits = re.sub(r"\D", "", cleaned)
+    digits = phone.translate(_KEEP_DIGITS)
     if len(digits) < 7:
         return ("invalid", f"too few digits ({len(digits)}): {phone}")
 
@@ -66,72 +151,62 @@ def heuristic_check(phone: str, name: str, source: str) -> tuple[str, str]:
         return ("invalid", f"too many digits ({len(digits)}): {phone}")
 
     # Generic placeholder patterns
-    if re.search(r"123-?4567", phone):
+    if any(p in phone for p in _PLACEHOLDERS):
         return ("fake", f"placeholder number: {phone}")
 
-    if re.search(r"000-?0000", phone):
+    if any(z in phone for z in _ZEROS):
         return ("fake", f"zeros pattern: {phone}")
 
     # Source is a generic company page, not personal
-    company_page_patterns = [
-        r"kroger\.com", r"fiu\.edu", r"rit\.edu", r"utdallas\.edu",
-        r"fremont\.gov", r"umich\.edu", r"stanford\.edu",
-        r"/contact-us", r"/contact$", r"/faqs",
-    ]
-    for pattern in company_page_patterns:
-        if re.search(pattern, source, re.IGNORECASE):
-            return ("suspect", f"likely company/org number from {source}")
+    source_lc = source.lower()
+    if any(sub in source_lc for sub in _COMPANY_SUBSTRINGS) or source_lc.endswith(_COMPANY_TAILS):
+        return ("suspect", f"likely company/org number from {source}")
 
     # Looks OK by heuristics
     return ("ok", "passed heuristic checks")
 
 
-def verify_with_exa(name: str, phone: str, bio: str, location: str, email: str) -> dict:
-    """Use Exa to verify if a phone number belongs to the person."""
+# Timeouts and dropped connections are retried along with 429/5xx responses
+exa = ExaClient(EXA_API_KEY, "exa-enrich/1.0", REQUESTS_PER_SEC, retry_network_errors=True)
+
+
+def describe_person(name: str, bio: str, location: str) -> str:
     person_desc = name
     if bio:
         person_desc += f" ({bio[:100]})"
     if location:
         person_desc += f" in {location}"
+    return person_desc
 
-    query = (
-        f"Verify: does the phone number {phone} belong to {person_desc}? "
-        f"Their email is {email}. "
-        f"Search for this person and check if this phone number is actually theirs, "
-        f"or if it's a company main line / wrong person / generic number. "
-        f"If you find their real phone number, provide it."
-    )
 
-    body = json.dumps({
-        "query": query,
-        "text": True,
-        "outputSchema": VERIFY_SCHEMA,
-    }).encode()
-
-    req = urllib.request.Request(
-        "https://api.exa.ai/answer",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "exa-enrich/1.0",
-            "x-api-key": EXA_API_KEY,
-        },
-    )
+def unverified(reason: str) -> dict:
+    return {"is_valid": None, "reason": reason, "corrected_phone": ""}
+
 
+def ask_exa(body: bytes) -> tuple[dict | list | str | None, str]:
+    """Send one query body to Exa. Returns (answer, ""), where an answer that
+    is not valid JSON comes back as its text, or (None, error) if the request
+    itself failed."""
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
+        status, raw = exa.post_answer(body, timeout=30)
+        if status >= 400:
+            err_body = raw.decode(errors="replace")
+            return None, f"API error ({status}): {err_body[:200]}"
+        data = json_loads(raw)
     except Exception as e:
-        return {"is_valid": None, "reason": f"API error: {e}", "corrected_phone": ""}
+        return None, f"API error: {e}"
 
     answer = data.get("answer", {})
     if isinstance(answer, str):
         try:
-            answer = json.loads(answer)
+            answer = json_loads(answer)
         except (json.JSONDecodeError, TypeError):
-            return {"is_valid": None, "reason": answer[:200], "corrected_phone": ""}
+            pass
+
+    return answer, ""
 
+
+def pick_result(answer: dict) -> dict:
     return {
         "is_valid": answer.get("is_valid"),
         "reason": answer.get("reason", ""),
@@ -139,55 +214,189 @@ def verify_with_exa(name: str, phone: str, bio: str, location: str, email: str)
     }
 
 
-def main():
-    # Read CSV handling NUL bytes
-    with open(INPUT_CSV, newline="", encoding="utf-8", errors="replace") as f:
-        content = f.read().replace("\x00", "")
-    rows = list(csv.DictReader(io.StringIO(content)))
-    fieldnames = list(rows[0].keys()) if rows else []
+def verify_with_exa(name: str, phone: str, bio: str, location: str, email: str) -> dict:
+    """Use Exa to verify if a phone number belongs to the person."""
+    query = (
+        f"Verify: does the phone number {phone} belong to {describe_person(name, bio, location)}? "
+        f"Their email is {email}. "
+        f"Search for this person and {VERIFY_HINT}"
+    )
+    answer, error = ask_exa(b'{"query":' + json_dumps(query) + _BODY_TAIL)
+    if error:
+        return unverified(error)
+    if isinstance(answer, str):
+        return unverified(answer[:200])
+    return pick_result(answer if isinstance(answer, dict) else {})
+
+
+SUSPECT_COLS = ("name", "phone_number", "bio", "location", "email")  # In verify_with_exa's argument order
+
+
+def row_fields(row: dict) -> tuple[str, ...]:
+    """Stripped (name, phone, bio, location, email) of a suspect row.
+
+    Taken once per suspect in phase 1; everything downstream works on this
+    tuple rather than re-reading and re-stripping the row.
+    """
+    return tuple(row.get(col, "").strip() for col in SUSPECT_COLS)
 
-    # Add validation columns
-    for col in ("phone_status", "phone_review_note", "verified_phone"):
-        if col not in fieldnames:
-            fieldnames.append(col)
 
-    total = len(rows)
+def verify_key(fields: tuple[str, ...]) -> tuple[str, str, str]:
+    """Normalized (name, phone digits, email): suspects sharing it get the same verdict."""
+    name, phone, _, _, email = fields
+    return name.casefold(), phone.translate(_KEEP_DIGITS), email.casefold()
+
+
+def cache_query(key: tuple[str, str, str]) -> str:
+    """The string a verify_key is stored under in the Exa cache."""
+    return "\n".join(key)
+
+
+def verify_batch(suspects: list[tuple[str, ...]]) -> list[dict]:
+    """Verify several suspects' row_fields in one Exa call, matched back by list number.
+
+    Anyone the batch answer leaves out, or everyone if it comes back in an
+    unexpected shape, is verified on their own with verify_with_exa. If the
+    call itself fails, every suspect records the error.
+    """
+    if len(suspects) == 1:
+        return [verify_with_exa(*suspects[0])]
+
+    lines = []
+    for i, (name, phone, bio, location, email) in enumerate(suspects, 1):
+        lines.append(f"{i}) Does the phone number {phone} belong to {describe_person(name, bio, location)}? "
+                     f"Their email is {email}.")
+    query = (
+        "Verify each of these phone numbers:\n\n" + "\n".join(lines) + "\n\n"
+        f"For each one, search for the person and {VERIFY_HINT} "
+        "Return the number each phone number is listed under."
+    )
+
+    answer, error = ask_exa(b'{"query":' + json_dumps(query) + _BATCH_BODY_TAIL)
+    if error:
+        return [unverified(error) for _ in suspects]
+    if isinstance(answer, dict):
+        answer = answer.get("results", [])
+
+    by_id = {}
+    for item in answer if isinstance(answer, list) else []:
+        try:
+            by_id.setdefault(int(item["id"]), item)
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    return [
+        pick_result(by_id[i]) if i in by_id else verify_with_exa(*fields)
+        for i, fields in enumerate(suspects, 1)
+    ]
+
+
+# Phase 1 log label for each heuristic status that gets a line of its own
+ROW_LABELS = {"fake": "REMOVED", "invalid": "REMOVED", "partial": "PARTIAL", "suspect": "SUSPECT"}
+
+
+def strip_nul(lines):
+    """Drop NUL bytes (left by interrupted writes) as lines are read."""
+    for line in lines:
+        yield line.replace("\x00", "")
+
+
+CLEARED_STATUSES = ("fake", "invalid")  # Heuristic outcomes whose phone is removed
+
+
+@functools.lru_cache(maxsize=HEURISTIC_CACHE_SIZE)
+def _check_pair(phone: str, source: str) -> tuple[str, str]:
+    # heuristic_check never reads the name, so it is left out of the key
+    return heuristic_check(phone, "", source)
+
+
+def check_cells(phone: str, source: str) -> tuple[str, str]:
+    """heuristic_check on a row's raw phone and phone_source cells.
+
+    Enriched files repeat the same placeholder numbers and source pages
+    across many rows, so outcomes are memoized per distinct (phone, source)
+    and each pair is only checked once.
+    """
+    phone = phone.strip()
+    if not phone:
+        # Usually the bulk of an enriched file; skip the stripping and the call
+        return "empty", "no phone"
+    return _check_pair(phone, source.strip())
+
+
+def apply_heuristics(row: dict) -> tuple[str, str]:
+    """Run the heuristic checks on a row and record the outcome on it.
+
+    Fake and invalid numbers are cleared. Returns (status, reason) from
+    heuristic_check.
+    """
+    status, reason = check_cells(row.get("phone_number", ""), row.get("phone_source", ""))
+    row["phone_status"] = status
+    row["phone_review_note"] = reason
+    row["verified_phone"] = ""
+    if status in CLEARED_STATUSES:
+        row["phone_number"] = ""
+        row["phone_status"] = "removed"
+    return status, reason
+
+
+def classify_chunk(rows: list[dict]) -> list[tuple[dict, str, str]]:
+    return [(row, *apply_heuristics(row)) for row in rows]
+
+
+def classify_rows(rows):
+    """Yield (row, status, reason) for each row, in order, via apply_heuristics.
+
+    With --processes above 1, an input longer than one chunk is split into
+    CHUNK_ROWS-row chunks checked in a process pool. The rows come back as
+    copies, with the outcome recorded on them.
+    """
+    rows = iter(rows)
+    chunks = iter(lambda: list(itertools.islice(rows, CHUNK_ROWS)), [])
+    first = next(chunks, [])
+    if PROCESSES <= 1 or len(first) < CHUNK_ROWS:
+        for row in itertools.chain(first, rows):
+            yield (row, *apply_heuristics(row))
+        return
+    with ProcessPoolExecutor(max_workers=PROCESSES) as pool:
+        for _, classified in submit_in_order(pool, classify_chunk, itertools.chain([first], chunks), PROCESSES * 2):
+            yield from classified
+
+
+def main():
     stats = {"empty": 0, "ok": 0, "fake": 0, "partial": 0, "invalid": 0, "suspect": 0, "verified": 0, "rejected": 0}
 
-    print(f"Validating {total} rows from {INPUT_CSV}...\n")
+    print(f"Validating rows from {INPUT_CSV}...\n")
     print("=" * 70)
     print("PHASE 1: Heuristic checks")
     print("=" * 70)
 
+    # Stream the input rather than loading it whole; only the suspects,
+    # which phase 2 updates, are kept in memory. The output is written by a
+    # second streaming pass once they are resolved.
     suspect_rows = []
+    log = []  # Flagged-row lines, written out in one go after the scan
+    total = 0
 
-    for i, row in enumerate(rows):
-        phone = row.get("phone_number", "").strip()
-        name = row.get("name", "").strip()
-        source = row.get("phone_source", "").strip()
-
-        status, reason = heuristic_check(phone, name, source)
-        stats[status] += 1
-
-        row["phone_status"] = status
-        row["phone_review_note"] = reason
-        row["verified_phone"] = ""
-
-        if status == "fake":
-            # Clear fake numbers
-            row["phone_number"] = ""
-            row["phone_status"] = "removed"
-            print(f"  REMOVED  {name}: {reason}")
-        elif status == "partial":
-            row["phone_status"] = "partial"
-            print(f"  PARTIAL  {name}: {reason}")
-        elif status == "invalid":
-            row["phone_number"] = ""
-            row["phone_status"] = "removed"
-            print(f"  REMOVED  {name}: {reason}")
-        elif status == "suspect":
-            suspect_rows.append((i, row))
-            print(f"  SUSPECT  {name}: {reason}")
+    with open(INPUT_CSV, newline="", encoding="utf-8", errors="replace") as f:
+        reader = csv.DictReader(strip_nul(f))
+        fieldnames = list(reader.fieldnames or [])
+
+        for i, (row, status, reason) in enumerate(classify_rows(reader)):
+            total += 1
+            stats[status] += 1
+
+            if status == "suspect":
+                suspect_rows.append((i, row, row_fields(row)))
+            if status in ROW_LABELS and not QUIET:
+                log.append(f"  {ROW_LABELS[status]}  {row.get('name', '').strip()}: {reason}\n")
+
+    sys.stdout.write("".join(log))
+
+    # Add validation columns
+    for col in ("phone_status", "phone_review_note", "verified_phone"):
+        if col not in fieldnames:
+            fieldnames.append(col)
 
     print(f"\nHeuristic results:")
     print(f"  Empty (no phone):  {stats['empty']}")
@@ -199,52 +408,108 @@ def main():
 
     # Phase 2: Verify suspect numbers with Exa
     if suspect_rows:
+        # A person listed more than once with the same number is only sent
+        # once; the other rows reuse that verdict. So do people verified by
+        # an earlier run, whose verdicts come from the on-disk cache.
+        first = {}
+        for _, _, fields in suspect_rows:
+            first.setdefault(verify_key(fields), fields)
+        cache = ExaCache(CACHE_TABLE, VERIFY_SCHEMA)
+        verdicts = {}
+        if not NO_CACHE:
+            for key in first:
+                hit = cache.get(cache_query(key))
+                if hit is not None:
+                    verdicts[key] = hit
+        unique = [fields for key, fields in first.items() if key not in verdicts]
+
         print(f"\n{'=' * 70}")
-        print(f"PHASE 2: Verifying {len(suspect_rows)} suspect numbers with Exa")
+        print(f"PHASE 2: Verifying {len(suspect_rows)} suspect numbers with Exa "
+              f"({len(unique)} to look up, {len(verdicts)} from cache {CACHE_PATH}, {WORKERS} workers)")
         print(f"{'=' * 70}")
 
-        for j, (idx, row) in enumerate(suspect_rows):
-            name = row.get("name", "").strip()
-            phone = row.get("phone_number", "").strip()
-            bio = row.get("bio", "").strip()
-            location = row.get("location", "").strip()
-            email = row.get("email", "").strip()
-
-            print(f"\n  [{j + 1}/{len(suspect_rows)}] {name} — {phone}")
-
-            result = verify_with_exa(name, phone, bio, location, email)
-
-            if result["is_valid"] is True:
-                row["phone_status"] = "verified"
-                row["phone_review_note"] = f"Verified: {result['reason']}"
-                stats["verified"] += 1
-                print(f"    VERIFIED: {result['reason']}")
-            elif result["is_valid"] is False:
-                row["phone_status"] = "rejected"
-                row["phone_review_note"] = f"Rejected: {result['reason']}"
-                stats["rejected"] += 1
-                print(f"    REJECTED: {result['reason']}")
-                if result["corrected_phone"]:
-                    row["verified_phone"] = result["corrected_phone"]
-                    print(f"    CORRECTED -> {result['corrected_phone']}")
+        # Batches of suspects run concurrently under the rate limiter; map
+        # hands the results back in first-seen order, so the log reads the
+        # same as before
+        batches = [unique[k:k + BATCH_SIZE] for k in range(0, len(unique), BATCH_SIZE)]
+        fresh = []
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            results = itertools.chain.from_iterable(executor.map(verify_batch, batches))
+            for j, (idx, row, fields) in enumerate(suspect_rows):
+                key = verify_key(fields)
+                if key not in verdicts:
+                    verdicts[key] = next(results)
+                    fresh.append((key, verdicts[key]))
+                result = verdicts[key]
+                name, phone = fields[:2]
+
+                print(f"\n  [{j + 1}/{len(suspect_rows)}] {name} — {phone}")
+
+                if result["is_valid"] is True:
+                    row["phone_status"] = "verified"
+                    row["phone_review_note"] = f"Verified: {result['reason']}"
+                    stats["verified"] += 1
+                    print(f"    VERIFIED: {result['reason']}")
+                elif result["is_valid"] is False:
+                    row["phone_status"] = "rejected"
+                    row["phone_review_note"] = f"Rejected: {result['reason']}"
+                    stats["rejected"] += 1
+                    print(f"    REJECTED: {result['reason']}")
+                    if result["corrected_phone"]:
+                        row["verified_phone"] = result["corrected_phone"]
+                        print(f"    CORRECTED -> {result['corrected_phone']}")
+                    else:
+                        row["phone_number"] = ""
                 else:
-                    row["phone_number"] = ""
+                    row["phone_status"] = "unverified"
+                    row["phone_review_note"] = f"Could not verify: {result['reason']}"
+                    print(f"    UNVERIFIED: {result['reason']}")
+
+        # Only definite verdicts are kept, so errors get retried next run
+        cache.put_many([
+            (cache_query(key), result, None) for key, result in fresh if result["is_valid"] is not None
+        ])
+        cache.close()
+
+    # Write output in a second streaming pass, re-deriving each non-suspect
+    # row from the input (the heuristics are cheap and deterministic) and
+    # counting the phones that survived. Rows stay plain lists here, indexed
+    # by column position, so no dict is built or unpacked per row.
+    suspects = {i: row for i, row, _ in suspect_rows}
+    final_phones = 0
+    with open(INPUT_CSV, newline="", encoding="utf-8", errors="replace") as f_in, \
+            open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f_out:
+        reader = csv.reader(strip_nul(f_in))
+        width = len(next(reader, []))
+        pad = [""] * (len(fieldnames) - width)
+        col = {name: k for k, name in enumerate(fieldnames)}
+        phone_at, source_at = col.get("phone_number"), col.get("phone_source")
+        status_at, note_at, verified_at = col["phone_status"], col["phone_review_note"], col["verified_phone"]
+
+        writer = csv.writer(f_out)
+        writer.writerow(fieldnames)
+        # Blank lines are skipped, as DictReader did in phase 1, so the row
+        # numbers line up with the suspects'
+        for i, row in enumerate(row for row in reader if row):
+            if i in suspects:
+                row = [suspects[i].get(name, "") for name in fieldnames]
             else:
-                row["phone_status"] = "unverified"
-                row["phone_review_note"] = f"Could not verify: {result['reason']}"
-                print(f"    UNVERIFIED: {result['reason']}")
-
-            if j < len(suspect_rows) - 1:
-                time.sleep(0.5)
-
-    # Write output
-    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+                # Short rows are padded and extra cells dropped, as DictReader/DictWriter did
+                row = row[:width] + [""] * (width - len(row)) + pad
+                status, reason = check_cells(
+                    row[phone_at] if phone_at is not None else "",
+                    row[source_at] if source_at is not None else "",
+                )
+                row[status_at] = "removed" if status in CLEARED_STATUSES else status
+                row[note_at] = reason
+                row[verified_at] = ""
+                if status in CLEARED_STATUSES:
+                    row[phone_at] = ""
+            writer.writerow(row)
+            if phone_at is not None and (row[phone_at] or "").strip():
+                final_phones += 1
 
     # Final stats
-    final_phones = sum(1 for r in rows if r.get("phone_number", "").strip())
     removed = total - stats["empty"] - final_phones - stats["partial"]
 
     print(f"\n{'=' * 70}")